@@ -12,7 +12,7 @@ from pathlib import Path
 # Add parent directory to path so we can import app modules
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-from app.core.config import settings
+from app.core.config import get_settings
 from app.db.base import Base
 # Import all models so Alembic can detect them
 import app.models  # noqa: F401
@@ -22,7 +22,7 @@ import app.models  # noqa: F401
 config = context.config
 
 # Set sqlalchemy.url from app settings
-config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+config.set_main_option("sqlalchemy.url", get_settings().DATABASE_URL)
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
@@ -0,0 +1,56 @@
+"""Store money amounts as NUMERIC(12, 2)
+
+Revision ID: 3c1f8e2a9b47
+Revises: 6fb68dba4e3f
+Create Date: 2026-10-15 10:12:41.503918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f8e2a9b47'
+down_revision: Union[str, None] = '6fb68dba4e3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, nullable)
+MONEY_COLUMNS = [
+    ('event_briefs', 'budget_min', True),
+    ('event_briefs', 'budget_max', False),
+    ('venues', 'base_price', True),
+    ('venues', 'min_spend', True),
+    ('venue_pricing', 'base_price', False),
+    ('venue_pricing', 'min_spend', True),
+    ('offers', 'price', False),
+    ('offers', 'min_spend', True),
+    ('bookings', 'deposit_amount', True),
+    ('bookings', 'total_amount', False),
+]
+
+
+def upgrade() -> None:
+    for table, column, nullable in MONEY_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.Float(),
+            type_=sa.Numeric(12, 2),
+            existing_nullable=nullable,
+            postgresql_using=f'round({column}::numeric, 2)',
+        )
+
+
+def downgrade() -> None:
+    for table, column, nullable in MONEY_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.Numeric(12, 2),
+            type_=sa.Float(),
+            existing_nullable=nullable,
+        )
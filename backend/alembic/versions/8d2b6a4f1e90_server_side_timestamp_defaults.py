@@ -0,0 +1,61 @@
+"""Generate timestamp defaults in the database
+
+Revision ID: 8d2b6a4f1e90
+Revises: 3c1f8e2a9b47
+Create Date: 2026-10-15 11:02:17.884312
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2b6a4f1e90'
+down_revision: Union[str, None] = '3c1f8e2a9b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TIMESTAMP_COLUMNS = [
+    ('users', 'created_at'),
+    ('users', 'updated_at'),
+    ('event_briefs', 'created_at'),
+    ('event_briefs', 'updated_at'),
+    ('venues', 'created_at'),
+    ('venues', 'updated_at'),
+    ('venue_photos', 'created_at'),
+    ('venue_pricing', 'created_at'),
+    ('venue_availability', 'created_at'),
+    ('venue_availability', 'updated_at'),
+    ('match_results', 'created_at'),
+    ('offers', 'created_at'),
+    ('offers', 'updated_at'),
+    ('bookings', 'created_at'),
+    ('bookings', 'updated_at'),
+    ('reviews', 'created_at'),
+    ('message_relay_logs', 'sent_at'),
+]
+
+
+def upgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"),
+            existing_nullable=True,
+        )
+
+
+def downgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.DateTime(),
+            server_default=None,
+            existing_nullable=True,
+        )
@@ -0,0 +1,44 @@
+"""Add composite indexes for brief, venue, offer and match queries
+
+Revision ID: b5e07c93d2a1
+Revises: 8d2b6a4f1e90
+Create Date: 2026-10-15 11:40:52.126734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e07c93d2a1'
+down_revision: Union[str, None] = '8d2b6a4f1e90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_event_briefs_status_borough_date', 'event_briefs', ['status', 'borough_pref', 'date_preferred'], unique=False)
+    op.create_index('ix_event_briefs_host_id_created_at', 'event_briefs', ['host_id', 'created_at'], unique=False)
+    op.create_index('ix_venues_borough_capacity', 'venues', ['borough', 'capacity_min', 'capacity_max'], unique=False)
+    op.create_index('ix_match_results_brief_id_rank', 'match_results', ['brief_id', 'rank'], unique=False)
+    op.create_index('ix_offers_brief_id_status', 'offers', ['brief_id', 'status'], unique=False)
+
+    # Single-column indexes now covered by the leading column of a composite
+    op.drop_index('ix_event_briefs_status', table_name='event_briefs')
+    op.drop_index('ix_venues_borough', table_name='venues')
+    op.drop_index('ix_match_results_brief_id', table_name='match_results')
+    op.drop_index('ix_offers_brief_id', table_name='offers')
+
+
+def downgrade() -> None:
+    op.create_index('ix_offers_brief_id', 'offers', ['brief_id'], unique=False)
+    op.create_index('ix_match_results_brief_id', 'match_results', ['brief_id'], unique=False)
+    op.create_index('ix_venues_borough', 'venues', ['borough'], unique=False)
+    op.create_index('ix_event_briefs_status', 'event_briefs', ['status'], unique=False)
+
+    op.drop_index('ix_offers_brief_id_status', table_name='offers')
+    op.drop_index('ix_match_results_brief_id_rank', table_name='match_results')
+    op.drop_index('ix_venues_borough_capacity', table_name='venues')
+    op.drop_index('ix_event_briefs_host_id_created_at', table_name='event_briefs')
+    op.drop_index('ix_event_briefs_status_borough_date', table_name='event_briefs')
@@ -0,0 +1,47 @@
+"""Store headcount, rank and rating as SMALLINT
+
+Revision ID: e41a9f06c7d3
+Revises: b5e07c93d2a1
+Create Date: 2026-10-15 13:25:09.617402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e41a9f06c7d3'
+down_revision: Union[str, None] = 'b5e07c93d2a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SMALL_COLUMNS = [
+    ('event_briefs', 'headcount'),
+    ('match_results', 'rank'),
+    ('reviews', 'rating'),
+]
+
+
+def upgrade() -> None:
+    for table, column in SMALL_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.Integer(),
+            type_=sa.SmallInteger(),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    for table, column in SMALL_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.SmallInteger(),
+            type_=sa.Integer(),
+            existing_nullable=False,
+        )
@@ -0,0 +1,44 @@
+"""Add covering indexes for venue photos and offers
+
+Revision ID: f7c2d5e8a310
+Revises: e41a9f06c7d3
+Create Date: 2026-10-15 14:03:44.208175
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7c2d5e8a310'
+down_revision: Union[str, None] = 'e41a9f06c7d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_venue_photos_venue_hero_order',
+        'venue_photos',
+        ['venue_id', sa.text('is_hero DESC'), 'order', 'id'],
+        unique=False,
+        postgresql_include=['url'],
+    )
+
+    op.drop_index('ix_offers_brief_id_status', table_name='offers')
+    op.create_index(
+        'ix_offers_brief_id_status',
+        'offers',
+        ['brief_id', 'status'],
+        unique=False,
+        postgresql_include=['venue_id', 'price', 'expires_at'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_offers_brief_id_status', table_name='offers')
+    op.create_index('ix_offers_brief_id_status', 'offers', ['brief_id', 'status'], unique=False)
+
+    op.drop_index('ix_venue_photos_venue_hero_order', table_name='venue_photos')
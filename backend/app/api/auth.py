@@ -2,11 +2,16 @@
 Authentication API endpoints
 """
 
+from typing import Optional
+
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import Optional
 
+from app.core.cache import cache_get, cache_set, cache_delete
+from app.core.config import Settings, get_settings
 from app.db.base import get_db
 from app.models.user import User
 from app.schemas.auth import (
@@ -20,27 +25,58 @@ from app.schemas.auth import (
 from app.core.security import (
     verify_password,
     get_password_hash,
+    get_dummy_password_hash,
     create_access_token,
     verify_token,
     generate_mock_otp,
     verify_mock_otp,
 )
 
+# Endpoints that hash passwords or query the database are plain `def` so FastAPI
+# runs them in its threadpool instead of blocking the event loop.
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 security = HTTPBearer()
 
 
+def _user_cache_key(user_id: int) -> str:
+    """Cache key for the authenticated-user snapshot used by get_current_user"""
+    return f"user:{user_id}"
+
+
+def _duplicate_user_field(error: IntegrityError) -> Optional[str]:
+    """
+    Work out which unique user column an INSERT collided with
+
+    Returns:
+        "email" or "phone", or None if the error is not a duplicate user
+    """
+    # psycopg2 exposes the violated index name (ix_users_email / ix_users_phone);
+    # other drivers only name the column in the message
+    diag = getattr(error.orig, "diag", None)
+    source = getattr(diag, "constraint_name", None) or str(error.orig)
+    for field in ("email", "phone"):
+        if field in source:
+            return field
+    return None
+
+
 # Dependency to get current user from JWT token
-async def get_current_user(
+def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db),
+    settings: Settings = Depends(get_settings),
 ) -> User:
     """
     Dependency to extract and validate current user from JWT token
 
+    The user row is cached for USER_CACHE_TTL_SECONDS, so a cache hit returns
+    a detached User built from the cached fields without querying the DB.
+    Endpoints that modify a user must call cache_delete(_user_cache_key(id)).
+
     Args:
         credentials: HTTP Bearer token credentials
         db: Database session
+        settings: Application settings
 
     Returns:
         Current authenticated user
@@ -58,15 +94,23 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user_id: Optional[int] = payload.get("sub")
-    if user_id is None:
+    # JWT requires "sub" to be a string, so the user ID is stored as one
+    subject = payload.get("sub")
+    if not isinstance(subject, str) or not subject.isdigit():
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    user_id = int(subject)
 
-    user = db.query(User).filter(User.id == user_id).first()
+    cached = cache_get(_user_cache_key(user_id))
+    if cached is not None:
+        # The snapshot is our own UserResponse JSON (plain ints, strings and
+        # bools), so it needs no re-validation
+        return User(**orjson.loads(cached))
+
+    user = db.get(User, user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -74,11 +118,17 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    cache_set(
+        _user_cache_key(user_id),
+        UserResponse.model_validate(user).model_dump_json(),
+        settings.USER_CACHE_TTL_SECONDS,
+    )
+
     return user
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserCreate, db: Session = Depends(get_db)):
+def register(user_data: UserCreate, db: Session = Depends(get_db)):
     """
     Register a new user
 
@@ -90,25 +140,8 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
         Created user data
 
     Raises:
-        HTTPException: If email already exists
+        HTTPException: If email or phone already exists
     """
-    # Check if email already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered",
-        )
-
-    # Check if phone already exists (if provided)
-    if user_data.phone:
-        existing_phone = db.query(User).filter(User.phone == user_data.phone).first()
-        if existing_phone:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Phone number already registered",
-            )
-
     # Create new user
     hashed_password = get_password_hash(user_data.password)
     new_user = User(
@@ -122,15 +155,30 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
         phone_verified=False,
     )
 
+    # Let the unique indexes on email/phone reject duplicates instead of
+    # pre-checking, which saves round-trips and closes the check-then-insert race
     db.add(new_user)
+    try:
+        db.flush()
+    except IntegrityError as e:
+        db.rollback()
+        field = _duplicate_user_field(e)
+        if field is None:
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered" if field == "email" else "Phone number already registered",
+        )
+    # Defaults come back from the INSERT (eager_defaults), so build the response
+    # before commit expires the instance instead of re-selecting it
+    response = UserResponse.model_validate(new_user)
     db.commit()
-    db.refresh(new_user)
 
-    return new_user
+    return response
 
 
 @router.post("/login", response_model=Token)
-async def login(credentials: UserLogin, db: Session = Depends(get_db)):
+def login(credentials: UserLogin, db: Session = Depends(get_db)):
     """
     Login with email and password
 
@@ -147,8 +195,9 @@ async def login(credentials: UserLogin, db: Session = Depends(get_db)):
     # Find user by email
     user = db.query(User).filter(User.email == credentials.email).first()
 
-    # Verify password
-    if not user or not verify_password(credentials.password, user.hashed_password):
+    # Verify password, against a dummy hash for unknown emails so both cases take as long
+    hashed_password = user.hashed_password if user else get_dummy_password_hash()
+    if not verify_password(credentials.password, hashed_password) or not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -156,7 +205,7 @@ async def login(credentials: UserLogin, db: Session = Depends(get_db)):
         )
 
     # Create access token
-    access_token = create_access_token(data={"sub": user.id})
+    access_token = create_access_token(data={"sub": str(user.id)})
 
     return Token(access_token=access_token)
 
@@ -203,7 +252,7 @@ async def request_otp(otp_request: OTPRequest):
 
 
 @router.post("/otp/verify", response_model=Token)
-async def verify_otp(otp_verify: OTPVerify, db: Session = Depends(get_db)):
+def verify_otp(otp_verify: OTPVerify, db: Session = Depends(get_db)):
     """
     Verify OTP code and return JWT token (MOCK for MVP)
 
@@ -244,8 +293,9 @@ async def verify_otp(otp_verify: OTPVerify, db: Session = Depends(get_db)):
     # Mark phone as verified
     user.phone_verified = True
     db.commit()
+    cache_delete(_user_cache_key(user.id))
 
     # Create access token
-    access_token = create_access_token(data={"sub": user.id})
+    access_token = create_access_token(data={"sub": str(user.id)})
 
     return Token(access_token=access_token)
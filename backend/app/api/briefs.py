@@ -3,7 +3,8 @@ Event Brief API endpoints
 """
 
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Request, status, BackgroundTasks
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.api.auth import get_current_user
@@ -16,9 +17,7 @@ from app.schemas.brief import (
     EventBriefResponse,
     EventBriefListResponse,
 )
-from app.services.matcher import VenueMatcher
-from app.services.llm import MatchExplainer
-from app.models.offer import MatchResult
+from app.workers.matching import enqueue_match_generation
 
 router = APIRouter(prefix="/briefs", tags=["briefs"])
 
@@ -26,6 +25,7 @@ router = APIRouter(prefix="/briefs", tags=["briefs"])
 @router.post("/", response_model=EventBriefResponse, status_code=status.HTTP_201_CREATED)
 def create_brief(
     brief: EventBriefCreate,
+    request: Request,
     background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -33,7 +33,7 @@ def create_brief(
     """
     Create a new event brief.
     Only hosts can create briefs.
-    Automatically triggers venue matching in the background.
+    Automatically queues venue matching for the new brief.
     """
     # Check if user is a host
     if not current_user.is_host:
@@ -48,57 +48,16 @@ def create_brief(
         **brief.model_dump(),
     )
     db.add(db_brief)
+    db.flush()
+    # Defaults come back from the INSERT (eager_defaults), so build the response
+    # before commit expires the instance instead of re-selecting it
+    response = EventBriefResponse.model_validate(db_brief)
     db.commit()
-    db.refresh(db_brief)
 
-    # Trigger matching in background
-    background_tasks.add_task(_generate_matches_for_brief, db, db_brief)
+    # Trigger matching in the background
+    enqueue_match_generation(request, background_tasks, response.id)
 
-    return db_brief
-
-
-def _generate_matches_for_brief(db: Session, brief: EventBrief):
-    """
-    Background task to generate matches for a newly created brief.
-    """
-    try:
-        # Initialize services
-        matcher = VenueMatcher(db)
-        explainer = MatchExplainer()
-
-        # Find matches
-        scored_venues = matcher.find_matches(brief, limit=10)
-
-        # Store matches with explanations
-        for rank, (venue, score, details) in enumerate(scored_venues, start=1):
-            # Generate explanation using Claude
-            try:
-                explanation = explainer.generate_explanation(
-                    venue, brief, score, details
-                )
-            except Exception as e:
-                # Use fallback if Claude API fails
-                print(f"Failed to generate explanation: {e}")
-                explanation = explainer._generate_fallback_explanation(
-                    venue, brief, score, details
-                )
-
-            # Create match result
-            match_result = MatchResult(
-                brief_id=brief.id,
-                venue_id=venue.id,
-                score=score,
-                explanation=explanation,
-                rank=rank
-            )
-            db.add(match_result)
-
-        db.commit()
-        print(f"Auto-generated {len(scored_venues)} matches for brief {brief.id}")
-
-    except Exception as e:
-        db.rollback()
-        print(f"Error generating matches: {e}")
+    return response
 
 
 @router.get("/", response_model=EventBriefListResponse)
@@ -132,11 +91,20 @@ def list_briefs(
             detail="Access denied",
         )
 
-    # Order by most recent first
-    query = query.order_by(EventBrief.created_at.desc())
-
-    total = query.count()
-    briefs = query.offset(skip).limit(limit).all()
+    # Fetch the page and the total match count in one round-trip by
+    # attaching COUNT(*) OVER () to every row
+    rows = query.add_columns(
+        func.count().over().label("total")
+    ).order_by(EventBrief.created_at.desc()).offset(skip).limit(limit).all()
+
+    if rows:
+        total = rows[0].total
+    elif skip:
+        # Page is past the end, so the window had no rows to report on
+        total = query.count()
+    else:
+        total = 0
+    briefs = [row[0] for row in rows]
 
     return EventBriefListResponse(briefs=briefs, total=total)
 
@@ -152,7 +120,7 @@ def get_brief(
     - Hosts can view their own briefs
     - Venue owners can view any active brief
     """
-    brief = db.query(EventBrief).filter(EventBrief.id == brief_id).first()
+    brief = db.get(EventBrief, brief_id)
 
     if not brief:
         raise HTTPException(
@@ -184,7 +152,7 @@ def update_brief(
     Update an event brief.
     Only the host who created the brief can update it.
     """
-    brief = db.query(EventBrief).filter(EventBrief.id == brief_id).first()
+    brief = db.get(EventBrief, brief_id)
 
     if not brief:
         raise HTTPException(
@@ -220,7 +188,7 @@ def delete_brief(
     Delete (cancel) an event brief.
     Only the host who created the brief can delete it.
     """
-    brief = db.query(EventBrief).filter(EventBrief.id == brief_id).first()
+    brief = db.get(EventBrief, brief_id)
 
     if not brief:
         raise HTTPException(
@@ -3,7 +3,8 @@ Matching API endpoints - Generate and retrieve venue matches for briefs
 """
 
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Request, status, BackgroundTasks
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.api.auth import get_current_user
@@ -12,15 +13,15 @@ from app.models.user import User
 from app.models.brief import EventBrief
 from app.models.offer import MatchResult
 from app.models.venue import Venue
-from app.services.matcher import VenueMatcher
-from app.services.llm import MatchExplainer
+from app.workers.matching import enqueue_match_generation
 
 router = APIRouter(prefix="/matching", tags=["matching"])
 
 
 @router.post("/briefs/{brief_id}/generate", status_code=status.HTTP_202_ACCEPTED)
-async def generate_matches(
+def generate_matches(
     brief_id: int,
+    request: Request,
     background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -30,7 +31,7 @@ async def generate_matches(
     This runs the matching algorithm and stores results in the database.
     """
     # Get the brief
-    brief = db.query(EventBrief).filter(EventBrief.id == brief_id).first()
+    brief = db.get(EventBrief, brief_id)
     if not brief:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -57,11 +58,7 @@ async def generate_matches(
         }
 
     # Run matching in background
-    background_tasks.add_task(
-        _generate_and_store_matches,
-        db,
-        brief
-    )
+    enqueue_match_generation(request, background_tasks, brief.id)
 
     return {
         "message": "Matching started - results will be available shortly",
@@ -70,7 +67,7 @@ async def generate_matches(
 
 
 @router.get("/briefs/{brief_id}/matches")
-async def get_matches(
+def get_matches(
     brief_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -80,7 +77,7 @@ async def get_matches(
     Returns venues ranked by match score with explanations.
     """
     # Get the brief
-    brief = db.query(EventBrief).filter(EventBrief.id == brief_id).first()
+    brief = db.get(EventBrief, brief_id)
     if not brief:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -94,12 +91,32 @@ async def get_matches(
             detail="You don't have permission to view matches for this brief"
         )
 
-    # Get matches (ordered by rank)
-    matches = db.query(MatchResult).filter(
-        MatchResult.brief_id == brief_id
-    ).order_by(MatchResult.rank).all()
+    # Select just the response columns with their venues in one query (ordered
+    # by rank); plain row mappings skip building and tracking ORM instances
+    rows = db.execute(
+        select(
+            MatchResult.id.label("match_id"),
+            MatchResult.rank,
+            MatchResult.score,
+            MatchResult.explanation,
+            MatchResult.created_at,
+            Venue.id.label("venue_id"),
+            Venue.name,
+            Venue.description,
+            Venue.borough,
+            Venue.neighborhood,
+            Venue.address,
+            Venue.capacity_min,
+            Venue.capacity_max,
+            Venue.base_price,
+            Venue.min_spend,
+        )
+        .join(Venue, Venue.id == MatchResult.venue_id)
+        .where(MatchResult.brief_id == brief_id)
+        .order_by(MatchResult.rank)
+    ).mappings().all()
 
-    if not matches:
+    if not rows:
         # No matches yet - trigger generation
         return {
             "brief_id": brief_id,
@@ -109,76 +126,29 @@ async def get_matches(
 
     # Format response with venue details
     results = []
-    for match in matches:
-        venue = db.query(Venue).filter(Venue.id == match.venue_id).first()
-        if venue:
-            results.append({
-                "match_id": match.id,
-                "rank": match.rank,
-                "score": match.score,
-                "explanation": match.explanation,
-                "venue": {
-                    "id": venue.id,
-                    "name": venue.name,
-                    "description": venue.description,
-                    "borough": venue.borough.value,
-                    "neighborhood": venue.neighborhood,
-                    "address": venue.address,
-                    "capacity_min": venue.capacity_min,
-                    "capacity_max": venue.capacity_max,
-                    "base_price": venue.base_price,
-                    "min_spend": venue.min_spend,
-                },
-                "created_at": match.created_at
-            })
+    for row in rows:
+        results.append({
+            "match_id": row["match_id"],
+            "rank": row["rank"],
+            "score": row["score"],
+            "explanation": row["explanation"],
+            "venue": {
+                "id": row["venue_id"],
+                "name": row["name"],
+                "description": row["description"],
+                "borough": row["borough"].value,
+                "neighborhood": row["neighborhood"],
+                "address": row["address"],
+                "capacity_min": row["capacity_min"],
+                "capacity_max": row["capacity_max"],
+                "base_price": row["base_price"],
+                "min_spend": row["min_spend"],
+            },
+            "created_at": row["created_at"]
+        })
 
     return {
         "brief_id": brief_id,
         "match_count": len(results),
         "matches": results
     }
-
-
-def _generate_and_store_matches(db: Session, brief: EventBrief):
-    """
-    Background task to generate matches and store them in the database.
-    """
-    try:
-        # Initialize services
-        matcher = VenueMatcher(db)
-        explainer = MatchExplainer()
-
-        # Find matches
-        scored_venues = matcher.find_matches(brief, limit=10)
-
-        # Store matches with explanations
-        for rank, (venue, score, details) in enumerate(scored_venues, start=1):
-            # Generate explanation using Claude
-            try:
-                explanation = explainer.generate_explanation(
-                    venue, brief, score, details
-                )
-            except Exception as e:
-                # Use fallback if Claude API fails
-                print(f"Failed to generate explanation: {e}")
-                explanation = explainer._generate_fallback_explanation(
-                    venue, brief, score, details
-                )
-
-            # Create match result
-            match_result = MatchResult(
-                brief_id=brief.id,
-                venue_id=venue.id,
-                score=score,
-                explanation=explanation,
-                rank=rank
-            )
-            db.add(match_result)
-
-        db.commit()
-        print(f"Generated {len(scored_venues)} matches for brief {brief.id}")
-
-    except Exception as e:
-        db.rollback()
-        print(f"Error generating matches: {e}")
-        raise
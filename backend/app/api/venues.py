@@ -2,13 +2,20 @@
 Venue API endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from typing import List, Union
+
+from app.core.cache import cache_get, cache_set, cache_delete, cache_incr
+from app.core.config import Settings, get_settings
 from app.db.base import get_db
 from app.models.user import User
 from app.models.venue import Venue, VenuePhoto, VenueAmenity, VenuePricing, VenueAvailability
+from app.services.matcher import invalidate_venue_candidates
 from app.schemas.venue import (
     VenueCreate,
     VenueUpdate,
@@ -19,9 +26,49 @@ from app.api.auth import get_current_user
 
 router = APIRouter(prefix="/venues", tags=["Venues"])
 
+# Read endpoints are cached as serialized JSON. List pages embed a version
+# number in their keys, so any venue write invalidates every page at once.
+VENUE_LIST_VERSION_KEY = "venues:list:version"
+
+_venue_detail_list_adapter = TypeAdapter(List[VenueResponse])
+
+# Load every relationship VenueResponse embeds with one query each, instead of
+# lazy-loading them per venue
+_venue_detail_options = (
+    selectinload(Venue.photos),
+    selectinload(Venue.amenities),
+    selectinload(Venue.pricing_packages),
+    selectinload(Venue.availability),
+)
+
+
+def _venue_cache_key(venue_id: int) -> str:
+    return f"venue:{venue_id}"
+
+
+def _owner_venues_cache_key(owner_id: int) -> str:
+    return f"venues:owner:{owner_id}"
+
+
+def _venue_list_cache_key(skip: int, limit: int) -> str:
+    version = cache_get(VENUE_LIST_VERSION_KEY) or b"0"
+    return f"venues:list:v{version.decode()}:{skip}:{limit}"
+
+
+def _json_response(content: Union[str, bytes]) -> Response:
+    """Return already-serialized JSON without re-validating it"""
+    return Response(content=content, media_type="application/json")
+
+
+def _invalidate_venue_cache(venue_id: int, owner_id: int) -> None:
+    """Drop cached reads affected by a change to one venue"""
+    cache_delete(_venue_cache_key(venue_id), _owner_venues_cache_key(owner_id))
+    cache_incr(VENUE_LIST_VERSION_KEY)
+    invalidate_venue_candidates()
+
 
 @router.post("", response_model=VenueResponse, status_code=status.HTTP_201_CREATED)
-async def create_venue(
+def create_venue(
     venue_data: VenueCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -73,56 +120,85 @@ async def create_venue(
     db.add(new_venue)
     db.flush()  # Get venue ID before adding related records
 
-    # Add photos
-    for photo_data in venue_data.photos:
-        photo = VenuePhoto(
-            venue_id=new_venue.id,
-            url=photo_data.url,
-            is_hero=photo_data.is_hero,
-            order=photo_data.order,
-        )
-        db.add(photo)
-
-    # Add amenities
-    for amenity_data in venue_data.amenities:
-        amenity = VenueAmenity(
-            venue_id=new_venue.id,
-            amenity_type=amenity_data.amenity_type,
-            details=amenity_data.details,
-        )
-        db.add(amenity)
-
-    # Add pricing packages
-    for pricing_data in venue_data.pricing_packages:
-        pricing = VenuePricing(
-            venue_id=new_venue.id,
-            package_name=pricing_data.package_name,
-            base_price=pricing_data.base_price,
-            min_spend=pricing_data.min_spend,
-            inclusions=pricing_data.inclusions,
-        )
-        db.add(pricing)
-
-    # Add availability
+    # Insert each kind of related record with a single statement
+    photos = _bulk_insert(db, VenuePhoto, [
+        {
+            "venue_id": new_venue.id,
+            "url": photo_data.url,
+            "is_hero": photo_data.is_hero,
+            "order": photo_data.order,
+        }
+        for photo_data in venue_data.photos
+    ])
+
+    amenities = _bulk_insert(db, VenueAmenity, [
+        {
+            "venue_id": new_venue.id,
+            "amenity_type": amenity_data.amenity_type,
+            "details": amenity_data.details,
+        }
+        for amenity_data in venue_data.amenities
+    ])
+
+    pricing_packages = _bulk_insert(db, VenuePricing, [
+        {
+            "venue_id": new_venue.id,
+            "package_name": pricing_data.package_name,
+            "base_price": pricing_data.base_price,
+            "min_spend": pricing_data.min_spend,
+            "inclusions": pricing_data.inclusions,
+        }
+        for pricing_data in venue_data.pricing_packages
+    ])
+
+    availability = None
     if venue_data.availability:
-        availability = VenueAvailability(
-            venue_id=new_venue.id,
-            calendar_url=venue_data.availability.calendar_url,
-            sync_status="not_synced",
-        )
-        db.add(availability)
+        availability = _bulk_insert(db, VenueAvailability, [{
+            "venue_id": new_venue.id,
+            "calendar_url": venue_data.availability.calendar_url,
+            "sync_status": "not_synced",
+        }])[0]
+
+    # Attach the inserted rows so building the response doesn't lazy-load each
+    # collection, and build it before commit expires the instance
+    set_committed_value(new_venue, "photos", photos)
+    set_committed_value(new_venue, "amenities", amenities)
+    set_committed_value(new_venue, "pricing_packages", pricing_packages)
+    set_committed_value(new_venue, "availability", availability)
+    response = VenueResponse.model_validate(new_venue)
 
     db.commit()
-    db.refresh(new_venue)
+    _invalidate_venue_cache(response.id, response.owner_id)
 
-    return new_venue
+    return response
+
+
+def _bulk_insert(db: Session, model, rows: List[dict]) -> list:
+    """
+    Insert rows with one multi-row INSERT
+
+    Args:
+        db: Database session
+        model: ORM model class to insert into
+        rows: Column values for each row
+
+    Returns:
+        The inserted ORM objects, in the same order as rows
+    """
+    if not rows:
+        return []
+    return db.scalars(
+        insert(model).returning(model, sort_by_parameter_order=True),
+        rows,
+    ).all()
 
 
 @router.get("", response_model=List[VenueListResponse])
-async def list_venues(
+def list_venues(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
+    settings: Settings = Depends(get_settings),
 ):
     """
     List all venues (paginated)
@@ -131,40 +207,54 @@ async def list_venues(
         skip: Number of records to skip
         limit: Maximum number of records to return
         db: Database session
+        settings: Application settings
 
     Returns:
         List of venues with minimal data
     """
-    venues = db.query(Venue).offset(skip).limit(limit).all()
-
-    # Convert to list response format with hero photo
-    result = []
-    for venue in venues:
-        hero_photo = next((p.url for p in venue.photos if p.is_hero), None)
-        if not hero_photo and venue.photos:
-            hero_photo = venue.photos[0].url
-
-        result.append(
-            VenueListResponse(
-                id=venue.id,
-                name=venue.name,
-                borough=venue.borough,
-                neighborhood=venue.neighborhood,
-                capacity_min=venue.capacity_min,
-                capacity_max=venue.capacity_max,
-                base_price=venue.base_price,
-                verification_status=venue.verification_status,
-                hero_photo=hero_photo,
-            )
-        )
+    cache_key = _venue_list_cache_key(skip, limit)
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return _json_response(cached)
+
+    # Hero photo URL per venue, falling back to the first photo in display order
+    hero_photo = (
+        select(VenuePhoto.url)
+        .where(VenuePhoto.venue_id == Venue.id)
+        .order_by(VenuePhoto.is_hero.desc(), VenuePhoto.order, VenuePhoto.id)
+        .limit(1)
+        .correlate(Venue)
+        .scalar_subquery()
+    )
 
-    return result
+    # Select only the list columns so the page is a single query with no ORM
+    # hydration. The columns match VenueListResponse, so the rows are encoded
+    # as-is; the schema still documents the endpoint.
+    rows = db.execute(
+        select(
+            Venue.id,
+            Venue.name,
+            Venue.borough,
+            Venue.neighborhood,
+            Venue.capacity_min,
+            Venue.capacity_max,
+            Venue.base_price,
+            Venue.verification_status,
+            hero_photo.label("hero_photo"),
+        ).offset(skip).limit(limit)
+    ).all()
+
+    content = orjson.dumps([row._asdict() for row in rows])
+    cache_set(cache_key, content, settings.VENUE_CACHE_TTL_SECONDS)
+
+    return _json_response(content)
 
 
 @router.get("/my-venues", response_model=List[VenueResponse])
-async def get_my_venues(
+def get_my_venues(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    settings: Settings = Depends(get_settings),
 ):
     """
     Get all venues owned by the current user
@@ -172,18 +262,36 @@ async def get_my_venues(
     Args:
         current_user: Current authenticated user
         db: Database session
+        settings: Application settings
 
     Returns:
         List of user's venues with full details
     """
-    venues = db.query(Venue).filter(Venue.owner_id == current_user.id).all()
-    return venues
+    cache_key = _owner_venues_cache_key(current_user.id)
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return _json_response(cached)
+
+    venues = (
+        db.query(Venue)
+        .options(*_venue_detail_options)
+        .filter(Venue.owner_id == current_user.id)
+        .all()
+    )
+
+    content = _venue_detail_list_adapter.dump_json(
+        [VenueResponse.from_orm_fast(venue) for venue in venues]
+    )
+    cache_set(cache_key, content, settings.VENUE_CACHE_TTL_SECONDS)
+
+    return _json_response(content)
 
 
 @router.get("/{venue_id}", response_model=VenueResponse)
-async def get_venue(
+def get_venue(
     venue_id: int,
     db: Session = Depends(get_db),
+    settings: Settings = Depends(get_settings),
 ):
     """
     Get a single venue by ID with all details
@@ -191,6 +299,7 @@ async def get_venue(
     Args:
         venue_id: Venue ID
         db: Database session
+        settings: Application settings
 
     Returns:
         Venue data with all relationships
@@ -198,7 +307,12 @@ async def get_venue(
     Raises:
         HTTPException: If venue not found
     """
-    venue = db.query(Venue).filter(Venue.id == venue_id).first()
+    cache_key = _venue_cache_key(venue_id)
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return _json_response(cached)
+
+    venue = db.get(Venue, venue_id, options=_venue_detail_options)
 
     if not venue:
         raise HTTPException(
@@ -206,11 +320,14 @@ async def get_venue(
             detail="Venue not found",
         )
 
-    return venue
+    content = VenueResponse.from_orm_fast(venue).model_dump_json()
+    cache_set(cache_key, content, settings.VENUE_CACHE_TTL_SECONDS)
+
+    return _json_response(content)
 
 
 @router.put("/{venue_id}", response_model=VenueResponse)
-async def update_venue(
+def update_venue(
     venue_id: int,
     venue_data: VenueUpdate,
     current_user: User = Depends(get_current_user),
@@ -231,7 +348,7 @@ async def update_venue(
     Raises:
         HTTPException: If venue not found or user is not the owner
     """
-    venue = db.query(Venue).filter(Venue.id == venue_id).first()
+    venue = db.get(Venue, venue_id)
 
     if not venue:
         raise HTTPException(
@@ -261,12 +378,13 @@ async def update_venue(
 
     db.commit()
     db.refresh(venue)
+    _invalidate_venue_cache(venue.id, venue.owner_id)
 
     return venue
 
 
 @router.delete("/{venue_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_venue(
+def delete_venue(
     venue_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -282,7 +400,7 @@ async def delete_venue(
     Raises:
         HTTPException: If venue not found or user is not the owner
     """
-    venue = db.query(Venue).filter(Venue.id == venue_id).first()
+    venue = db.get(Venue, venue_id)
 
     if not venue:
         raise HTTPException(
@@ -297,7 +415,9 @@ async def delete_venue(
             detail="You can only delete your own venues",
         )
 
+    owner_id = venue.owner_id
     db.delete(venue)
     db.commit()
+    _invalidate_venue_cache(venue_id, owner_id)
 
     return None
@@ -0,0 +1,90 @@
+"""
+Redis cache helpers
+
+Caching is optional: when REDIS_URL is not set (or Redis is unreachable)
+every read is a miss and writes are dropped, so the API keeps working
+against the database alone.
+"""
+
+import logging
+from functools import lru_cache
+from typing import Optional, Union
+
+import redis
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def get_redis() -> Optional[redis.Redis]:
+    """Return the shared Redis client, or None if caching is disabled"""
+    settings = get_settings()
+    if not settings.REDIS_URL:
+        return None
+    return redis.Redis.from_url(
+        settings.REDIS_URL,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+    )
+
+
+def cache_get(key: str) -> Optional[bytes]:
+    """
+    Read a cached value
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Raw cached bytes, or None on a miss or cache error
+    """
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        return client.get(key)
+    except redis.RedisError as e:
+        logger.warning("Cache read failed for %s: %s", key, e)
+        return None
+
+
+def cache_set(key: str, value: Union[str, bytes], ttl: int) -> None:
+    """
+    Store a value with an expiration
+
+    Args:
+        key: Cache key
+        value: Serialized value to store
+        ttl: Time to live in seconds
+    """
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.setex(key, ttl, value)
+    except redis.RedisError as e:
+        logger.warning("Cache write failed for %s: %s", key, e)
+
+
+def cache_delete(*keys: str) -> None:
+    """Remove cached values, e.g. after the underlying rows change"""
+    client = get_redis()
+    if client is None or not keys:
+        return
+    try:
+        client.delete(*keys)
+    except redis.RedisError as e:
+        logger.warning("Cache delete failed for %s: %s", keys, e)
+
+
+def cache_incr(key: str) -> None:
+    """Increment a counter, e.g. a version number embedded in other cache keys"""
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.incr(key)
+    except redis.RedisError as e:
+        logger.warning("Cache increment failed for %s: %s", key, e)
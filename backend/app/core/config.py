@@ -2,6 +2,7 @@
 Application configuration using Pydantic Settings
 """
 
+from functools import lru_cache
 from typing import List
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -12,6 +13,7 @@ class Settings(BaseSettings):
     # API Configuration
     PROJECT_NAME: str = "Event Venue Marketplace"
     API_V1_STR: str = "/api/v1"
+    LOG_LEVEL: str = "INFO"
 
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://127.0.0.1:3000"]
@@ -23,6 +25,27 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "CHANGE_THIS_IN_PRODUCTION_USE_LONG_RANDOM_STRING"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
+    BCRYPT_ROUNDS: int = 10
+    BCRYPT_TARGET_MS: int = 0  # If set, calibrate BCRYPT_ROUNDS to this hash time on startup
+    TOKEN_CACHE_SIZE: int = 10_000  # Decoded JWTs kept in memory; 0 disables the cache
+    TOKEN_CACHE_TTL_SECONDS: int = 30
+
+    # Cache (optional - leave REDIS_URL empty to disable caching)
+    REDIS_URL: str = ""
+    REDIS_SOCKET_TIMEOUT: float = 0.5  # seconds
+    USER_CACHE_TTL_SECONDS: int = 300
+    VENUE_CACHE_TTL_SECONDS: int = 60
+    MATCH_VENUE_CACHE_TTL_SECONDS: int = 30  # in-process verified-venue list used by matching
+    EXPLANATION_CACHE_TTL_SECONDS: int = 86400  # Claude match explanations, keyed by prompt
+
+    # Task queue (requires REDIS_URL and a running arq worker)
+    MATCH_QUEUE_ENABLED: bool = False
+
+    # Claude explanations: calls in flight at once per brief, and the match
+    # score band [MIN, MAX) that gets Claude; other scores use the template
+    EXPLANATION_CONCURRENCY: int = 8
+    EXPLANATION_LLM_MIN_SCORE: float = 60
+    EXPLANATION_LLM_MAX_SCORE: float = 85
 
     # External Services (mocked for MVP)
     STRIPE_SECRET_KEY: str = ""
@@ -49,4 +72,12 @@ class Settings(BaseSettings):
     )
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the application settings, parsing the environment and .env once
+
+    Use as a FastAPI dependency (Depends(get_settings)) so tests can swap
+    settings via app.dependency_overrides.
+    """
+    return Settings()
@@ -0,0 +1,53 @@
+"""
+Logging configuration
+
+Records are put on an in-memory queue and written to stderr by a listener
+thread, so request handlers and background tasks never block on stream I/O.
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from app.core.config import get_settings
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging() -> None:
+    """Route root logger output through a background listener thread (idempotent)"""
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s")
+    )
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(get_settings().LOG_LEVEL)
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def restart_logging_after_fork() -> None:
+    """
+    Start a fresh listener thread in a forked child process
+
+    Threads don't survive fork, so a worker forked after setup_logging() would
+    keep queueing records that nothing writes out. Call from the child.
+    """
+    global _listener
+    if _listener is None:
+        return
+    atexit.unregister(_listener.stop)
+    _listener = QueueListener(_listener.queue, *_listener.handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
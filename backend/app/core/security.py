@@ -2,28 +2,125 @@
 Security utilities for authentication and password hashing
 """
 
+import hashlib
+import hmac
+import logging
+import math
+import threading
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from app.core.config import settings
+from functools import lru_cache
+from typing import List, NamedTuple, Optional
+import bcrypt
+from cachetools import TTLCache
+import jwt
+from app.core.config import get_settings
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+logger = logging.getLogger(__name__)
+
+# Lowest cost calibration may pick (OWASP minimum for bcrypt)
+MIN_BCRYPT_ROUNDS = 10
+MAX_BCRYPT_ROUNDS = 16
+
+# Hash prefixes bcrypt.checkpw understands (passlib-era hashes use $2b$)
+BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+BCRYPT_HASH_LENGTH = 60
+
+
+def calibrate_bcrypt_rounds(target_ms: float) -> int:
+    """
+    Pick the highest bcrypt cost whose hash time stays within a latency budget
+
+    Each extra round doubles the work, so one timed hash at the minimum cost
+    is enough to extrapolate.
+
+    Args:
+        target_ms: Desired time for a single hash on this machine
+
+    Returns:
+        Bcrypt rounds between MIN_BCRYPT_ROUNDS and MAX_BCRYPT_ROUNDS
+    """
+    start = time.perf_counter()
+    bcrypt.hashpw(b"calibration-password", bcrypt.gensalt(rounds=MIN_BCRYPT_ROUNDS))
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    extra_rounds = math.floor(math.log2(target_ms / elapsed_ms)) if elapsed_ms < target_ms else 0
+    return max(MIN_BCRYPT_ROUNDS, min(MAX_BCRYPT_ROUNDS, MIN_BCRYPT_ROUNDS + extra_rounds))
+
+
+@lru_cache(maxsize=1)
+def get_bcrypt_rounds() -> int:
+    """
+    Bcrypt cost for new hashes, resolved on first use
+
+    Uses BCRYPT_ROUNDS, or calibrates the cost when BCRYPT_TARGET_MS is set.
+    Existing hashes keep verifying at whatever cost they were created with.
+    """
+    settings = get_settings()
+    rounds = settings.BCRYPT_ROUNDS
+    if settings.BCRYPT_TARGET_MS > 0:
+        rounds = calibrate_bcrypt_rounds(settings.BCRYPT_TARGET_MS)
+        logger.info("Calibrated bcrypt to %d rounds for a %d ms target", rounds, settings.BCRYPT_TARGET_MS)
+    return rounds
+
+
+def _bcrypt_secret(password: str) -> bytes:
+    """Encode a password and trim it to bcrypt's 72-byte limit"""
+    secret = password.encode('utf-8')
+    if len(secret) <= 72:
+        return secret
+    # Drop a multi-byte character split by the cut, matching existing hashes
+    return secret[:72].decode('utf-8', errors='ignore').encode('utf-8')
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password"""
-    # Bcrypt has a 72-byte password limit
-    password_bytes = plain_password.encode('utf-8')[:72]
-    return pwd_context.verify(password_bytes.decode('utf-8'), hashed_password)
+    # Reject malformed hashes before spending a full bcrypt round on them
+    if len(hashed_password) != BCRYPT_HASH_LENGTH or not hashed_password.startswith(BCRYPT_PREFIXES):
+        return False
+    try:
+        return bcrypt.checkpw(_bcrypt_secret(plain_password), hashed_password.encode('utf-8'))
+    except ValueError:
+        # Right shape but an invalid salt or cost
+        return False
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password for storage"""
-    # Bcrypt has a 72-byte password limit, truncate if necessary
-    password_bytes = password.encode('utf-8')[:72]
-    return pwd_context.hash(password_bytes.decode('utf-8'))
+    salt = bcrypt.gensalt(rounds=get_bcrypt_rounds())
+    return bcrypt.hashpw(_bcrypt_secret(password), salt).decode('utf-8')
+
+
+@lru_cache(maxsize=1)
+def get_dummy_password_hash() -> str:
+    """
+    Hash to verify against when a login names an unknown user
+
+    Checking it costs the same as a real password check, so response time
+    does not reveal whether an account exists.
+    """
+    return get_password_hash("x" * 32)
+
+
+class _JWTConfig(NamedTuple):
+    """Token signing parameters derived once from settings"""
+
+    secret: bytes
+    algorithm: str
+    algorithms: List[str]
+    default_expire: timedelta
+
+
+@lru_cache(maxsize=1)
+def _get_jwt_config() -> _JWTConfig:
+    """Encode the secret and build the algorithm list once instead of per token"""
+    settings = get_settings()
+    return _JWTConfig(
+        secret=settings.SECRET_KEY.encode("utf-8"),
+        algorithm=settings.ALGORITHM,
+        algorithms=[settings.ALGORITHM],
+        default_expire=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+    )
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -31,52 +128,83 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     Create a JWT access token
 
     Args:
-        data: Dictionary containing claims (typically {"sub": user_id})
+        data: Dictionary containing claims (typically {"sub": str(user_id)})
         expires_delta: Optional expiration time delta
 
     Returns:
         Encoded JWT token string
     """
+    config = _get_jwt_config()
     to_encode = data.copy()
 
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+    expire = datetime.now(timezone.utc) + (expires_delta or config.default_expire)
 
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, config.secret, algorithm=config.algorithm)
     return encoded_jwt
 
 
+_token_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_token_cache() -> Optional[TTLCache]:
+    """Cache of recently decoded tokens, or None if disabled"""
+    settings = get_settings()
+    if settings.TOKEN_CACHE_SIZE <= 0:
+        return None
+    return TTLCache(maxsize=settings.TOKEN_CACHE_SIZE, ttl=settings.TOKEN_CACHE_TTL_SECONDS)
+
+
 def verify_token(token: str) -> Optional[dict]:
     """
     Verify and decode a JWT token
 
+    Successfully decoded tokens are cached for a short TTL (never past their
+    own expiry), so a client reusing its token skips the signature check.
+    Failures are never cached.
+
     Args:
         token: JWT token string
 
     Returns:
         Decoded token payload if valid, None otherwise
     """
+    cache = _get_token_cache()
+    # Key by digest so raw bearer tokens are not kept in memory
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    now = time.time()
+
+    if cache is not None:
+        with _token_cache_lock:
+            cached = cache.get(key)
+        if cached is not None:
+            payload, expires_at = cached
+            if expires_at > now:
+                return payload
+
+    config = _get_jwt_config()
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
-    except JWTError:
+        payload = jwt.decode(token, config.secret, algorithms=config.algorithms)
+    except jwt.InvalidTokenError:
         return None
 
+    if cache is not None:
+        expires_at = min(payload.get("exp", now), now + cache.ttl)
+        with _token_cache_lock:
+            cache[key] = (payload, expires_at)
+    return payload
+
 
 def generate_mock_otp() -> str:
     """
     Generate a mock OTP code for MVP
 
     In production, this would use Twilio to send a real SMS OTP.
-    For MVP, we just return a fixed code and log it.
+    For MVP, we just return a fixed code and log it at DEBUG level.
     """
     mock_code = "123456"
-    print(f"[MOCK OTP] Generated code: {mock_code}")
+    logger.debug("[MOCK OTP] Generated code: %s", mock_code)
     return mock_code
 
 
@@ -85,8 +213,9 @@ def verify_mock_otp(code: str) -> bool:
     Verify a mock OTP code for MVP
 
     In production, this would verify against a stored OTP with expiration.
-    For MVP, we just accept "123456".
+    For MVP, we just accept "123456". The comparison is constant-time so the
+    real OTP check can reuse it without leaking how many digits matched.
     """
-    is_valid = code == "123456"
-    print(f"[MOCK OTP] Verifying code {code}: {'✓ valid' if is_valid else '✗ invalid'}")
+    is_valid = hmac.compare_digest(code.encode("utf-8"), b"123456")
+    logger.debug("[MOCK OTP] Verifying code %s: %s", code, "valid" if is_valid else "invalid")
     return is_valid
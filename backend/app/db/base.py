@@ -3,14 +3,13 @@ Database connection and session management
 """
 
 from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
-from app.core.config import settings
+from app.core.config import get_settings
 
 # Create database engine
 engine = create_engine(
-    settings.DATABASE_URL,
+    get_settings().DATABASE_URL,
     pool_pre_ping=True,  # Enable connection health checks
     echo=False,  # Set to True for SQL query logging during development
     connect_args={
@@ -21,8 +20,20 @@ engine = create_engine(
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Create declarative base for models
-Base = declarative_base()
+
+class ReprMixin:
+    """Generic __repr__ built from the columns listed in __repr_cols__"""
+
+    __repr_cols__ = ("id",)
+
+    def __repr__(self):
+        fields = ", ".join(f"{col}={getattr(self, col)}" for col in self.__repr_cols__)
+        return f"<{type(self).__name__}({fields})>"
+
+
+# Declarative base for models
+class Base(ReprMixin, DeclarativeBase):
+    pass
 
 
 def get_db():
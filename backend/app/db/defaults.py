@@ -0,0 +1,31 @@
+"""
+Shared column defaults
+"""
+
+from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class utcnow(FunctionElement):
+    """
+    Current UTC time, evaluated by the database
+
+    Used as server_default/onupdate for timestamp columns so rows get their
+    timestamps inside the INSERT/UPDATE instead of from a Python call per row.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow, "postgresql")
+def _pg_utcnow(element, compiler, **kw):
+    # Columns are TIMESTAMP WITHOUT TIME ZONE holding UTC, so convert explicitly
+    # rather than relying on the session time zone
+    return "timezone('utc', now())"
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
@@ -3,36 +3,43 @@ Event Venue Marketplace - FastAPI Backend
 Main application entry point
 """
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from arq import create_pool
+from arq.connections import RedisSettings
+from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.core.config import settings
+from fastapi.responses import ORJSONResponse
+from app.core.config import get_settings
+from app.core.logging_config import setup_logging
+from app.core.security import get_bcrypt_rounds, get_dummy_password_hash
 from app.api import auth, venues, briefs, matching
 
-app = FastAPI(
-    title="Event Venue Marketplace API",
-    description="Two-sided marketplace connecting event hosts with NYC venues",
-    version="1.0.0",
-    docs_url="/api/docs",
-    redoc_url="/api/redoc",
-)
-
-# CORS configuration for local development
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Include routers
-app.include_router(auth.router, prefix="/api")
-app.include_router(venues.router, prefix="/api")
-app.include_router(briefs.router, prefix="/api")
-app.include_router(matching.router, prefix="/api")
-
-
-@app.get("/")
+setup_logging()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the arq connection used to queue matching jobs, if enabled"""
+    settings = get_settings()
+    # Resolve (and, if configured, calibrate) the bcrypt cost before serving logins
+    get_bcrypt_rounds()
+    get_dummy_password_hash()
+    app.state.arq_pool = None
+    if settings.MATCH_QUEUE_ENABLED:
+        app.state.arq_pool = await create_pool(RedisSettings.from_dsn(settings.REDIS_URL))
+
+    yield
+
+    if app.state.arq_pool is not None:
+        await app.state.arq_pool.close()
+
+
+# Service-level endpoints outside the /api routers
+health_router = APIRouter()
+
+
+@health_router.get("/")
 async def root():
     """Health check endpoint"""
     return {
@@ -42,7 +49,7 @@ async def root():
     }
 
 
-@app.get("/api/health")
+@health_router.get("/api/health")
 async def health_check():
     """Detailed health check endpoint"""
     return {
@@ -55,3 +62,46 @@ async def health_check():
             "sms": "mocked"
         }
     }
+
+
+def create_app() -> FastAPI:
+    """
+    Build the FastAPI application
+
+    Called once at import; under gunicorn with preload_app the result is
+    built in the master and shared with every forked worker.
+    """
+    settings = get_settings()
+
+    app = FastAPI(
+        title="Event Venue Marketplace API",
+        description="Two-sided marketplace connecting event hosts with NYC venues",
+        version="1.0.0",
+        docs_url="/api/docs",
+        redoc_url="/api/redoc",
+        lifespan=lifespan,
+        # orjson encodes nested match/venue payloads and datetimes much faster than json
+        default_response_class=ORJSONResponse,
+    )
+
+    # CORS configuration for local development
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=tuple(settings.CORS_ORIGINS),
+        allow_credentials=True,
+        allow_methods=("GET", "POST", "PUT", "PATCH", "DELETE"),
+        allow_headers=["*"],
+    )
+
+    # Include routers
+    app.include_router(auth.router, prefix="/api")
+    app.include_router(venues.router, prefix="/api")
+    app.include_router(briefs.router, prefix="/api")
+    app.include_router(matching.router, prefix="/api")
+
+    app.include_router(health_router)
+
+    return app
+
+
+app = create_app()
@@ -2,52 +2,74 @@
 Event Brief model
 """
 
-from datetime import datetime, timezone, date
-from sqlalchemy import Column, Integer, String, Text, Float, Boolean, Date, DateTime, ForeignKey, Enum as SQLEnum
+from datetime import date, datetime
+from typing import Optional
+from sqlalchemy import Integer, SmallInteger, String, Text, Numeric, Boolean, Date, DateTime, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
 from app.db.base import Base
-from app.models.enums import EventType, FoodBevLevel, AlcoholLevel, AVNeeds, BriefStatus, Borough
+from app.db.defaults import utcnow
+from app.models.enums import (
+    EventType,
+    FoodBevLevel,
+    AlcoholLevel,
+    AVNeeds,
+    BriefStatus,
+    Borough,
+    EventTypeSQL,
+    FoodBevLevelSQL,
+    AlcoholLevelSQL,
+    AVNeedsSQL,
+    BriefStatusSQL,
+    BoroughSQL,
+)
 
 
 class EventBrief(Base):
     """Event brief submitted by hosts"""
 
     __tablename__ = "event_briefs"
+    __repr_cols__ = ("id", "event_type", "headcount", "status")
+    __table_args__ = (
+        # Venue owners browsing open briefs by location and date
+        Index("ix_event_briefs_status_borough_date", "status", "borough_pref", "date_preferred"),
+        # A host's briefs, newest first
+        Index("ix_event_briefs_host_id_created_at", "host_id", "created_at"),
+    )
+    # Populate server-side defaults from INSERT ... RETURNING instead of a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(Integer, primary_key=True, index=True)
-    host_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    host_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
 
     # Event details
-    event_type = Column(SQLEnum(EventType), nullable=False, index=True)
-    headcount = Column(Integer, nullable=False)
+    event_type: Mapped[EventType] = mapped_column(EventTypeSQL, nullable=False, index=True)
+    headcount: Mapped[int] = mapped_column(SmallInteger, nullable=False)
 
     # Date preferences
-    date_preferred = Column(Date, nullable=False, index=True)
-    date_flexible = Column(Boolean, default=False)
+    date_preferred: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    date_flexible: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
 
     # Location preferences
-    borough_pref = Column(SQLEnum(Borough), nullable=True, index=True)
-    neighborhood_pref = Column(String, nullable=True)
+    borough_pref: Mapped[Optional[Borough]] = mapped_column(BoroughSQL, nullable=True, index=True)
+    neighborhood_pref: Mapped[Optional[str]] = mapped_column(String, nullable=True)
 
     # Budget
-    budget_min = Column(Float, nullable=True)
-    budget_max = Column(Float, nullable=False)
+    budget_min: Mapped[Optional[float]] = mapped_column(Numeric(12, 2, asdecimal=False), nullable=True)
+    budget_max: Mapped[float] = mapped_column(Numeric(12, 2, asdecimal=False), nullable=False)
 
     # Requirements
-    food_bev_level = Column(SQLEnum(FoodBevLevel), default=FoodBevLevel.NONE)
-    alcohol_level = Column(SQLEnum(AlcoholLevel), default=AlcoholLevel.NONE)
-    av_needs = Column(SQLEnum(AVNeeds), default=AVNeeds.NONE)
-    accessibility_needs = Column(Text, nullable=True)
-    vibe = Column(String, nullable=True)  # casual, formal, creative, etc.
+    food_bev_level: Mapped[Optional[FoodBevLevel]] = mapped_column(FoodBevLevelSQL, default=FoodBevLevel.NONE)
+    alcohol_level: Mapped[Optional[AlcoholLevel]] = mapped_column(AlcoholLevelSQL, default=AlcoholLevel.NONE)
+    av_needs: Mapped[Optional[AVNeeds]] = mapped_column(AVNeedsSQL, default=AVNeeds.NONE)
+    accessibility_needs: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    vibe: Mapped[Optional[str]] = mapped_column(String, nullable=True)  # casual, formal, creative, etc.
 
     # Additional notes
-    notes = Column(Text, nullable=True)
+    notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Status
-    status = Column(SQLEnum(BriefStatus), default=BriefStatus.ACTIVE, index=True)
+    status: Mapped[Optional[BriefStatus]] = mapped_column(BriefStatusSQL, default=BriefStatus.ACTIVE)
 
     # Timestamps
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), index=True)
-    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
-
-    def __repr__(self):
-        return f"<EventBrief(id={self.id}, type={self.event_type}, headcount={self.headcount}, status={self.status})>"
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(), index=True)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(), onupdate=utcnow())
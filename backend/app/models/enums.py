@@ -1,9 +1,16 @@
 """
 Enum types for database models
+
+Columns store these as native Postgres enums labelled by member name
+(e.g. MANHATTAN). Loading a row maps each label back to its member with a
+single dict lookup, so the enums stay in the ORM layer; moving the columns
+to plain strings would need a data migration for little gain.
 """
 
 import enum
 
+from sqlalchemy import Enum as SQLEnum
+
 
 class EventType(str, enum.Enum):
     """Type of event"""
@@ -70,3 +77,31 @@ class Borough(str, enum.Enum):
     QUEENS = "queens"
     BRONX = "bronx"
     STATEN_ISLAND = "staten_island"
+
+
+# Display labels ("full_catering" -> "Full Catering"), built once per member
+_DISPLAY = {
+    member: member.value.replace('_', ' ').title()
+    for enum_cls in (
+        EventType, FoodBevLevel, AlcoholLevel, AVNeeds,
+        OfferStatus, BookingStatus, BriefStatus, Borough,
+    )
+    for member in enum_cls
+}
+
+
+def display(member: enum.Enum) -> str:
+    """Human-readable label for an enum member"""
+    return _DISPLAY[member]
+
+
+# Column types shared by every column using an enum, so each Postgres type
+# (named as in the initial migration) is defined once
+EventTypeSQL = SQLEnum(EventType, name="eventtype")
+FoodBevLevelSQL = SQLEnum(FoodBevLevel, name="foodbevlevel")
+AlcoholLevelSQL = SQLEnum(AlcoholLevel, name="alcohollevel")
+AVNeedsSQL = SQLEnum(AVNeeds, name="avneeds")
+OfferStatusSQL = SQLEnum(OfferStatus, name="offerstatus")
+BookingStatusSQL = SQLEnum(BookingStatus, name="bookingstatus")
+BriefStatusSQL = SQLEnum(BriefStatus, name="briefstatus")
+BoroughSQL = SQLEnum(Borough, name="borough")
@@ -2,119 +2,125 @@
 Offer and Booking models
 """
 
-from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, Enum as SQLEnum
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Integer, SmallInteger, String, Text, Float, Numeric, DateTime, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
 from app.db.base import Base
-from app.models.enums import OfferStatus, BookingStatus
+from app.db.defaults import utcnow
+from app.models.enums import OfferStatus, BookingStatus, OfferStatusSQL, BookingStatusSQL
 
 
 class MatchResult(Base):
     """AI matching results for brief-venue pairs"""
 
     __tablename__ = "match_results"
+    __repr_cols__ = ("brief_id", "venue_id", "score", "rank")
+    __table_args__ = (
+        # A brief's matches in rank order
+        Index("ix_match_results_brief_id_rank", "brief_id", "rank"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    brief_id = Column(Integer, ForeignKey("event_briefs.id"), nullable=False, index=True)
-    venue_id = Column(Integer, ForeignKey("venues.id"), nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    brief_id: Mapped[int] = mapped_column(Integer, ForeignKey("event_briefs.id"), nullable=False)
+    venue_id: Mapped[int] = mapped_column(Integer, ForeignKey("venues.id"), nullable=False, index=True)
 
-    score = Column(Float, nullable=False)  # Matching score (0-100)
-    explanation = Column(Text, nullable=True)  # AI-generated explanation bullets
-    rank = Column(Integer, nullable=False)  # Rank in the match results (1, 2, 3...)
+    score: Mapped[float] = mapped_column(Float, nullable=False)  # Matching score (0-100)
+    explanation: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # AI-generated explanation bullets
+    rank: Mapped[int] = mapped_column(SmallInteger, nullable=False)  # Rank in the match results (1, 2, 3...)
 
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), index=True)
-
-    def __repr__(self):
-        return f"<MatchResult(brief_id={self.brief_id}, venue_id={self.venue_id}, score={self.score}, rank={self.rank})>"
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(), index=True)
 
 
 class Offer(Base):
     """Venue offers to event briefs"""
 
     __tablename__ = "offers"
-
-    id = Column(Integer, primary_key=True, index=True)
-    brief_id = Column(Integer, ForeignKey("event_briefs.id"), nullable=False, index=True)
-    venue_id = Column(Integer, ForeignKey("venues.id"), nullable=False, index=True)
+    __repr_cols__ = ("id", "brief_id", "venue_id", "status")
+    __table_args__ = (
+        # Offers on a brief, filtered by status; the included columns let the
+        # offer summary be answered from the index alone
+        Index(
+            "ix_offers_brief_id_status",
+            "brief_id", "status",
+            postgresql_include=["venue_id", "price", "expires_at"],
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    brief_id: Mapped[int] = mapped_column(Integer, ForeignKey("event_briefs.id"), nullable=False)
+    venue_id: Mapped[int] = mapped_column(Integer, ForeignKey("venues.id"), nullable=False, index=True)
 
     # Offer details
-    package_name = Column(String, nullable=False)  # Package offered
-    price = Column(Float, nullable=False)
-    min_spend = Column(Float, nullable=True)
-    included_items = Column(Text, nullable=True)  # What's included (JSON or list)
-    terms = Column(Text, nullable=True)  # Terms and conditions
+    package_name: Mapped[str] = mapped_column(String, nullable=False)  # Package offered
+    price: Mapped[float] = mapped_column(Numeric(12, 2, asdecimal=False), nullable=False)
+    min_spend: Mapped[Optional[float]] = mapped_column(Numeric(12, 2, asdecimal=False), nullable=True)
+    included_items: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # What's included (JSON or list)
+    terms: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Terms and conditions
 
     # Expiration
-    expires_at = Column(DateTime, nullable=True)
+    expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Status
-    status = Column(SQLEnum(OfferStatus), default=OfferStatus.PENDING, index=True)
+    status: Mapped[Optional[OfferStatus]] = mapped_column(OfferStatusSQL, default=OfferStatus.PENDING, index=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), index=True)
-    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
-
-    def __repr__(self):
-        return f"<Offer(id={self.id}, brief_id={self.brief_id}, venue_id={self.venue_id}, status={self.status})>"
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(), index=True)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(), onupdate=utcnow())
 
 
 class Booking(Base):
     """Event bookings"""
 
     __tablename__ = "bookings"
+    __repr_cols__ = ("id", "brief_id", "status")
 
-    id = Column(Integer, primary_key=True, index=True)
-    brief_id = Column(Integer, ForeignKey("event_briefs.id"), nullable=False, index=True)
-    offer_id = Column(Integer, ForeignKey("offers.id"), nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    brief_id: Mapped[int] = mapped_column(Integer, ForeignKey("event_briefs.id"), nullable=False, index=True)
+    offer_id: Mapped[int] = mapped_column(Integer, ForeignKey("offers.id"), nullable=False, index=True)
 
     # Payment details
-    deposit_amount = Column(Float, nullable=True)
-    total_amount = Column(Float, nullable=False)
-    stripe_payment_intent_id = Column(String, nullable=True, unique=True)
+    deposit_amount: Mapped[Optional[float]] = mapped_column(Numeric(12, 2, asdecimal=False), nullable=True)
+    total_amount: Mapped[float] = mapped_column(Numeric(12, 2, asdecimal=False), nullable=False)
+    stripe_payment_intent_id: Mapped[Optional[str]] = mapped_column(String, nullable=True, unique=True)
 
     # Status
-    status = Column(SQLEnum(BookingStatus), default=BookingStatus.REQUESTED, index=True)
+    status: Mapped[Optional[BookingStatus]] = mapped_column(BookingStatusSQL, default=BookingStatus.REQUESTED, index=True)
 
     # Timestamps
-    confirmed_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), index=True)
-    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
-
-    def __repr__(self):
-        return f"<Booking(id={self.id}, brief_id={self.brief_id}, status={self.status})>"
+    confirmed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(), index=True)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(), onupdate=utcnow())
 
 
 class Review(Base):
     """Two-way reviews (host <-> venue)"""
 
     __tablename__ = "reviews"
+    __repr_cols__ = ("id", "booking_id", "rating")
 
-    id = Column(Integer, primary_key=True, index=True)
-    booking_id = Column(Integer, ForeignKey("bookings.id"), nullable=False, index=True)
-    reviewer_id = Column(Integer, ForeignKey("users.id"), nullable=False)  # Who wrote the review
-    reviewee_id = Column(Integer, ForeignKey("users.id"), nullable=False)  # Who is being reviewed
-
-    rating = Column(Integer, nullable=False)  # 1-5 stars
-    comment = Column(Text, nullable=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    booking_id: Mapped[int] = mapped_column(Integer, ForeignKey("bookings.id"), nullable=False, index=True)
+    reviewer_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)  # Who wrote the review
+    reviewee_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)  # Who is being reviewed
 
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), index=True)
+    rating: Mapped[int] = mapped_column(SmallInteger, nullable=False)  # 1-5 stars
+    comment: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    def __repr__(self):
-        return f"<Review(id={self.id}, booking_id={self.booking_id}, rating={self.rating})>"
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(), index=True)
 
 
 class MessageRelayLog(Base):
     """Log of email/SMS notifications sent (for MVP mock tracking)"""
 
     __tablename__ = "message_relay_logs"
+    __repr_cols__ = ("id", "channel", "sent_at")
 
-    id = Column(Integer, primary_key=True, index=True)
-    sender_id = Column(Integer, ForeignKey("users.id"), nullable=True)
-    recipient_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-
-    channel = Column(String, nullable=False)  # email, sms
-    message_body = Column(Text, nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    sender_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("users.id"), nullable=True)
+    recipient_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
 
-    sent_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), index=True)
+    channel: Mapped[str] = mapped_column(String, nullable=False)  # email, sms
+    message_body: Mapped[str] = mapped_column(Text, nullable=False)
 
-    def __repr__(self):
-        return f"<MessageRelayLog(id={self.id}, channel={self.channel}, sent_at={self.sent_at})>"
+    sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(), index=True)
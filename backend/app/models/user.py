@@ -2,33 +2,36 @@
 User model
 """
 
-from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, DateTime, Boolean
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Integer, String, DateTime, Boolean
+from sqlalchemy.orm import Mapped, mapped_column
 from app.db.base import Base
+from app.db.defaults import utcnow
 
 
 class User(Base):
     """User account model - can be both host and venue owner"""
 
     __tablename__ = "users"
+    __repr_cols__ = ("id", "email", "name")
+    # Populate server-side defaults from INSERT ... RETURNING instead of a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(Integer, primary_key=True, index=True)
-    email = Column(String, unique=True, index=True, nullable=False)
-    phone = Column(String, unique=True, index=True, nullable=True)
-    name = Column(String, nullable=False)
-    hashed_password = Column(String, nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    email: Mapped[str] = mapped_column(String, unique=True, index=True, nullable=False)
+    phone: Mapped[Optional[str]] = mapped_column(String, unique=True, index=True, nullable=True)
+    name: Mapped[str] = mapped_column(String, nullable=False)
+    hashed_password: Mapped[str] = mapped_column(String, nullable=False)
 
     # User preferences
-    is_host = Column(Boolean, default=True)
-    is_venue_owner = Column(Boolean, default=False)
+    is_host: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
+    is_venue_owner: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
 
     # Verification status
-    email_verified = Column(Boolean, default=False)
-    phone_verified = Column(Boolean, default=False)
+    email_verified: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    phone_verified: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
 
     # Timestamps
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
-
-    def __repr__(self):
-        return f"<User(id={self.id}, email={self.email}, name={self.name})>"
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(), onupdate=utcnow())
@@ -2,132 +2,139 @@
 Venue and related models
 """
 
-from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, Text, Float, Boolean, DateTime, ForeignKey, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import Integer, String, Text, Numeric, Boolean, DateTime, ForeignKey, Index, desc
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
-from app.models.enums import Borough
+from app.db.defaults import utcnow
+from app.models.enums import Borough, BoroughSQL
 
 
 class Venue(Base):
     """Venue model"""
 
     __tablename__ = "venues"
+    __repr_cols__ = ("id", "name", "borough")
+    __table_args__ = (
+        # Matching filters venues by borough and headcount fit
+        Index("ix_venues_borough_capacity", "borough", "capacity_min", "capacity_max"),
+    )
+    # Populate server-side defaults from INSERT ... RETURNING instead of a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(Integer, primary_key=True, index=True)
-    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    owner_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
 
     # Basic info
-    name = Column(String, nullable=False, index=True)
-    description = Column(Text, nullable=True)
-    borough = Column(SQLEnum(Borough), nullable=False, index=True)
-    neighborhood = Column(String, nullable=True)
-    address = Column(String, nullable=False)
+    name: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    borough: Mapped[Borough] = mapped_column(BoroughSQL, nullable=False)
+    neighborhood: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    address: Mapped[str] = mapped_column(String, nullable=False)
 
     # Capacity
-    capacity_min = Column(Integer, nullable=False)
-    capacity_max = Column(Integer, nullable=False)
+    capacity_min: Mapped[int] = mapped_column(Integer, nullable=False)
+    capacity_max: Mapped[int] = mapped_column(Integer, nullable=False)
 
     # Pricing
-    base_price = Column(Float, nullable=True)  # Optional base price
-    min_spend = Column(Float, nullable=True)   # Optional minimum spend
+    base_price: Mapped[Optional[float]] = mapped_column(Numeric(12, 2, asdecimal=False), nullable=True)  # Optional base price
+    min_spend: Mapped[Optional[float]] = mapped_column(Numeric(12, 2, asdecimal=False), nullable=True)   # Optional minimum spend
 
     # Features
-    instant_book_enabled = Column(Boolean, default=False)
-    verification_status = Column(String, default="pending")  # pending, verified, rejected
+    instant_book_enabled: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    verification_status: Mapped[Optional[str]] = mapped_column(String, default="pending")  # pending, verified, rejected
 
     # Timestamps
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(), onupdate=utcnow())
 
     # Relationships
-    photos = relationship("VenuePhoto", back_populates="venue", cascade="all, delete-orphan")
-    amenities = relationship("VenueAmenity", back_populates="venue", cascade="all, delete-orphan")
-    pricing_packages = relationship("VenuePricing", back_populates="venue", cascade="all, delete-orphan")
-    availability = relationship("VenueAvailability", back_populates="venue", uselist=False, cascade="all, delete-orphan")
-
-    def __repr__(self):
-        return f"<Venue(id={self.id}, name={self.name}, borough={self.borough})>"
+    photos: Mapped[List["VenuePhoto"]] = relationship("VenuePhoto", back_populates="venue", cascade="all, delete-orphan")
+    amenities: Mapped[List["VenueAmenity"]] = relationship("VenueAmenity", back_populates="venue", cascade="all, delete-orphan")
+    pricing_packages: Mapped[List["VenuePricing"]] = relationship("VenuePricing", back_populates="venue", cascade="all, delete-orphan")
+    availability: Mapped[Optional["VenueAvailability"]] = relationship("VenueAvailability", back_populates="venue", uselist=False, cascade="all, delete-orphan")
 
 
 class VenuePhoto(Base):
     """Venue photos"""
 
     __tablename__ = "venue_photos"
-
-    id = Column(Integer, primary_key=True, index=True)
-    venue_id = Column(Integer, ForeignKey("venues.id"), nullable=False)
-
-    url = Column(String, nullable=False)
-    is_hero = Column(Boolean, default=False)  # Hero/cover image
-    order = Column(Integer, default=0)  # Display order
-
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    __repr_cols__ = ("id", "venue_id", "is_hero")
+    __table_args__ = (
+        # Covers the hero-photo lookup (first photo by is_hero, order, id) so
+        # listing venues reads the URL from the index without touching the heap
+        Index(
+            "ix_venue_photos_venue_hero_order",
+            "venue_id", desc("is_hero"), "order", "id",
+            postgresql_include=["url"],
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    venue_id: Mapped[int] = mapped_column(Integer, ForeignKey("venues.id"), nullable=False)
+
+    url: Mapped[str] = mapped_column(String, nullable=False)
+    is_hero: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)  # Hero/cover image
+    order: Mapped[Optional[int]] = mapped_column(Integer, default=0)  # Display order
+
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow())
 
     # Relationships
-    venue = relationship("Venue", back_populates="photos")
-
-    def __repr__(self):
-        return f"<VenuePhoto(id={self.id}, venue_id={self.venue_id}, is_hero={self.is_hero})>"
+    venue: Mapped["Venue"] = relationship("Venue", back_populates="photos")
 
 
 class VenueAmenity(Base):
     """Venue amenities"""
 
     __tablename__ = "venue_amenities"
+    __repr_cols__ = ("id", "amenity_type")
 
-    id = Column(Integer, primary_key=True, index=True)
-    venue_id = Column(Integer, ForeignKey("venues.id"), nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    venue_id: Mapped[int] = mapped_column(Integer, ForeignKey("venues.id"), nullable=False)
 
-    amenity_type = Column(String, nullable=False)  # wifi, parking, av_equipment, kitchen, etc.
-    details = Column(Text, nullable=True)  # Additional details about the amenity
+    amenity_type: Mapped[str] = mapped_column(String, nullable=False)  # wifi, parking, av_equipment, kitchen, etc.
+    details: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Additional details about the amenity
 
     # Relationships
-    venue = relationship("Venue", back_populates="amenities")
-
-    def __repr__(self):
-        return f"<VenueAmenity(id={self.id}, type={self.amenity_type})>"
+    venue: Mapped["Venue"] = relationship("Venue", back_populates="amenities")
 
 
 class VenuePricing(Base):
     """Venue pricing packages"""
 
     __tablename__ = "venue_pricing"
+    __repr_cols__ = ("id", "package_name", "base_price")
 
-    id = Column(Integer, primary_key=True, index=True)
-    venue_id = Column(Integer, ForeignKey("venues.id"), nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    venue_id: Mapped[int] = mapped_column(Integer, ForeignKey("venues.id"), nullable=False)
 
-    package_name = Column(String, nullable=False)  # "Space Only", "Full Package", etc.
-    base_price = Column(Float, nullable=False)
-    min_spend = Column(Float, nullable=True)
-    inclusions = Column(Text, nullable=True)  # What's included (JSON or comma-separated)
+    package_name: Mapped[str] = mapped_column(String, nullable=False)  # "Space Only", "Full Package", etc.
+    base_price: Mapped[float] = mapped_column(Numeric(12, 2, asdecimal=False), nullable=False)
+    min_spend: Mapped[Optional[float]] = mapped_column(Numeric(12, 2, asdecimal=False), nullable=True)
+    inclusions: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # What's included (JSON or comma-separated)
 
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow())
 
     # Relationships
-    venue = relationship("Venue", back_populates="pricing_packages")
-
-    def __repr__(self):
-        return f"<VenuePricing(id={self.id}, package={self.package_name}, price={self.base_price})>"
+    venue: Mapped["Venue"] = relationship("Venue", back_populates="pricing_packages")
 
 
 class VenueAvailability(Base):
     """Venue calendar availability sync"""
 
     __tablename__ = "venue_availability"
+    __repr_cols__ = ("venue_id", "sync_status")
 
-    id = Column(Integer, primary_key=True, index=True)
-    venue_id = Column(Integer, ForeignKey("venues.id"), nullable=False, unique=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    venue_id: Mapped[int] = mapped_column(Integer, ForeignKey("venues.id"), nullable=False, unique=True)
 
-    calendar_url = Column(String, nullable=True)  # ICS calendar URL or Google Calendar link
-    sync_status = Column(String, default="not_configured")  # not_configured, syncing, synced, error
-    last_synced_at = Column(DateTime, nullable=True)
+    calendar_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)  # ICS calendar URL or Google Calendar link
+    sync_status: Mapped[Optional[str]] = mapped_column(String, default="not_configured")  # not_configured, syncing, synced, error
+    last_synced_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(), onupdate=utcnow())
 
     # Relationships
-    venue = relationship("Venue", back_populates="availability")
-
-    def __repr__(self):
-        return f"<VenueAvailability(venue_id={self.venue_id}, status={self.sync_status})>"
+    venue: Mapped["Venue"] = relationship("Venue", back_populates="availability")
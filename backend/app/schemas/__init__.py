@@ -1,59 +1,6 @@
 """
 Pydantic schemas for API request/response validation
-"""
-
-from app.schemas.auth import (
-    UserCreate,
-    UserLogin,
-    UserResponse,
-    Token,
-    TokenData,
-    OTPRequest,
-    OTPVerify,
-)
-from app.schemas.venue import (
-    VenueCreate,
-    VenueUpdate,
-    VenueResponse,
-    VenueListResponse,
-    VenuePhotoCreate,
-    VenuePhotoResponse,
-    VenueAmenityCreate,
-    VenueAmenityResponse,
-    VenuePricingCreate,
-    VenuePricingResponse,
-    VenueAvailabilityCreate,
-    VenueAvailabilityResponse,
-)
-from app.schemas.brief import (
-    EventBriefCreate,
-    EventBriefUpdate,
-    EventBriefResponse,
-    EventBriefListResponse,
-)
 
-__all__ = [
-    "UserCreate",
-    "UserLogin",
-    "UserResponse",
-    "Token",
-    "TokenData",
-    "OTPRequest",
-    "OTPVerify",
-    "VenueCreate",
-    "VenueUpdate",
-    "VenueResponse",
-    "VenueListResponse",
-    "VenuePhotoCreate",
-    "VenuePhotoResponse",
-    "VenueAmenityCreate",
-    "VenueAmenityResponse",
-    "VenuePricingCreate",
-    "VenuePricingResponse",
-    "VenueAvailabilityCreate",
-    "VenueAvailabilityResponse",
-    "EventBriefCreate",
-    "EventBriefUpdate",
-    "EventBriefResponse",
-    "EventBriefListResponse",
-]
+Import schemas from their submodules (e.g. app.schemas.brief) so loading one
+endpoint module does not build every model in the package.
+"""
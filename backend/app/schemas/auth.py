@@ -2,9 +2,13 @@
 Authentication schemas for request/response validation
 """
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing import Optional
 
+# Compiled once per schema by pydantic-core's linear-time regex engine
+PHONE_PATTERN = r"^\+?1?\d{10,15}$"
+OTP_CODE_PATTERN = r"^\d{6}$"
+
 
 class UserCreate(BaseModel):
     """Schema for user registration"""
@@ -36,8 +40,7 @@ class UserResponse(BaseModel):
     email_verified: bool
     phone_verified: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Token(BaseModel):
@@ -56,11 +59,11 @@ class TokenData(BaseModel):
 class OTPRequest(BaseModel):
     """Schema for requesting an OTP"""
 
-    phone: str = Field(..., pattern=r"^\+?1?\d{10,15}$")
+    phone: str = Field(..., pattern=PHONE_PATTERN)
 
 
 class OTPVerify(BaseModel):
     """Schema for verifying an OTP"""
 
-    phone: str = Field(..., pattern=r"^\+?1?\d{10,15}$")
-    code: str = Field(..., min_length=6, max_length=6)
+    phone: str = Field(..., pattern=PHONE_PATTERN)
+    code: str = Field(..., pattern=OTP_CODE_PATTERN)
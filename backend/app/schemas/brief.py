@@ -4,21 +4,25 @@ Pydantic schemas for event briefs
 
 from datetime import date, datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from app.models.enums import EventType, FoodBevLevel, AlcoholLevel, AVNeeds, BriefStatus, Borough
+from app.schemas.common import Money
+
+# Largest headcount the SMALLINT column can hold
+MAX_HEADCOUNT = 32_767
 
 
 # Request schemas
 class EventBriefCreate(BaseModel):
     """Schema for creating a new event brief"""
     event_type: EventType
-    headcount: int = Field(..., ge=1, description="Number of guests")
+    headcount: int = Field(..., ge=1, le=MAX_HEADCOUNT, description="Number of guests")
     date_preferred: date
     date_flexible: bool = False
     borough_pref: Optional[Borough] = None
     neighborhood_pref: Optional[str] = None
-    budget_min: Optional[float] = Field(None, ge=0)
-    budget_max: float = Field(..., ge=0)
+    budget_min: Optional[Money] = None
+    budget_max: Money
     food_bev_level: FoodBevLevel = FoodBevLevel.NONE
     alcohol_level: AlcoholLevel = AlcoholLevel.NONE
     av_needs: AVNeeds = AVNeeds.NONE
@@ -26,20 +30,19 @@ class EventBriefCreate(BaseModel):
     vibe: Optional[str] = None
     notes: Optional[str] = None
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class EventBriefUpdate(BaseModel):
     """Schema for updating an existing event brief"""
     event_type: Optional[EventType] = None
-    headcount: Optional[int] = Field(None, ge=1)
+    headcount: Optional[int] = Field(None, ge=1, le=MAX_HEADCOUNT)
     date_preferred: Optional[date] = None
     date_flexible: Optional[bool] = None
     borough_pref: Optional[Borough] = None
     neighborhood_pref: Optional[str] = None
-    budget_min: Optional[float] = Field(None, ge=0)
-    budget_max: Optional[float] = Field(None, ge=0)
+    budget_min: Optional[Money] = None
+    budget_max: Optional[Money] = None
     food_bev_level: Optional[FoodBevLevel] = None
     alcohol_level: Optional[AlcoholLevel] = None
     av_needs: Optional[AVNeeds] = None
@@ -48,8 +51,7 @@ class EventBriefUpdate(BaseModel):
     notes: Optional[str] = None
     status: Optional[BriefStatus] = None
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 # Response schemas
@@ -61,23 +63,21 @@ class EventBriefResponse(BaseModel):
     headcount: int
     date_preferred: date
     date_flexible: bool
-    borough_pref: Optional[Borough]
-    neighborhood_pref: Optional[str]
-    budget_min: Optional[float]
+    borough_pref: Optional[Borough] = None
+    neighborhood_pref: Optional[str] = None
+    budget_min: Optional[float] = None
     budget_max: float
     food_bev_level: FoodBevLevel
     alcohol_level: AlcoholLevel
     av_needs: AVNeeds
-    accessibility_needs: Optional[str]
-    vibe: Optional[str]
-    notes: Optional[str]
+    accessibility_needs: Optional[str] = None
+    vibe: Optional[str] = None
+    notes: Optional[str] = None
     status: BriefStatus
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-        use_enum_values = True
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
 
 class EventBriefListResponse(BaseModel):
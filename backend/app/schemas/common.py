@@ -0,0 +1,22 @@
+"""
+Field types shared by the request schemas
+"""
+
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Annotated
+from pydantic import AfterValidator, Field
+
+# Largest amount the NUMERIC(12, 2) money columns can hold
+MAX_MONEY = 9_999_999_999.99
+
+
+def _round_to_cents(value: float) -> float:
+    # Round the decimal the client sent, as the database does, rather than the
+    # nearest binary float (round(1000.555, 2) gives 1000.55)
+    return float(Decimal(str(value)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP))
+
+
+# Amounts are rounded to cents before the bounds are checked, so responses
+# echo exactly what the money columns store
+Money = Annotated[float, AfterValidator(_round_to_cents), Field(ge=0, le=MAX_MONEY)]
+PositiveMoney = Annotated[float, AfterValidator(_round_to_cents), Field(gt=0, le=MAX_MONEY)]
@@ -2,10 +2,18 @@
 Venue schemas for request/response validation
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Optional, List, Type, TypeVar
 from datetime import datetime
 from app.models.enums import Borough
+from app.schemas.common import PositiveMoney
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _construct(model: Type[ModelT], obj: Any) -> ModelT:
+    """Build a response model from a trusted ORM object without validating it"""
+    return model.model_construct(**{name: getattr(obj, name) for name in model.model_fields})
 
 
 # Venue Photo Schemas
@@ -25,8 +33,7 @@ class VenuePhotoResponse(BaseModel):
     order: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Venue Amenity Schemas
@@ -43,16 +50,15 @@ class VenueAmenityResponse(BaseModel):
     amenity_type: str
     details: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Venue Pricing Schemas
 class VenuePricingCreate(BaseModel):
     """Schema for creating a pricing package"""
     package_name: str
-    base_price: float = Field(..., gt=0)
-    min_spend: Optional[float] = Field(None, gt=0)
+    base_price: PositiveMoney
+    min_spend: Optional[PositiveMoney] = None
     inclusions: Optional[str] = None
 
 
@@ -66,8 +72,7 @@ class VenuePricingResponse(BaseModel):
     inclusions: Optional[str] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Venue Availability Schemas
@@ -86,8 +91,7 @@ class VenueAvailabilityResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Main Venue Schemas
@@ -102,8 +106,8 @@ class VenueCreate(BaseModel):
     capacity_min: int = Field(..., gt=0)
     capacity_max: int = Field(..., gt=0)
 
-    base_price: Optional[float] = Field(None, gt=0)
-    min_spend: Optional[float] = Field(None, gt=0)
+    base_price: Optional[PositiveMoney] = None
+    min_spend: Optional[PositiveMoney] = None
 
     instant_book_enabled: bool = False
 
@@ -125,8 +129,8 @@ class VenueUpdate(BaseModel):
     capacity_min: Optional[int] = Field(None, gt=0)
     capacity_max: Optional[int] = Field(None, gt=0)
 
-    base_price: Optional[float] = Field(None, gt=0)
-    min_spend: Optional[float] = Field(None, gt=0)
+    base_price: Optional[PositiveMoney] = None
+    min_spend: Optional[PositiveMoney] = None
 
     instant_book_enabled: Optional[bool] = None
     verification_status: Optional[str] = None
@@ -160,8 +164,31 @@ class VenueResponse(BaseModel):
     pricing_packages: List[VenuePricingResponse] = []
     availability: Optional[VenueAvailabilityResponse] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_orm_fast(cls, venue: Any) -> "VenueResponse":
+        """
+        Build from a loaded Venue without re-validating it
+
+        Rows read back from the database already have the right shape, so
+        read endpoints skip validation; request data still goes through
+        model_validate.
+        """
+        data = {
+            name: getattr(venue, name)
+            for name in cls.model_fields
+            if name not in ("photos", "amenities", "pricing_packages", "availability")
+        }
+        data["photos"] = [_construct(VenuePhotoResponse, photo) for photo in venue.photos]
+        data["amenities"] = [_construct(VenueAmenityResponse, amenity) for amenity in venue.amenities]
+        data["pricing_packages"] = [
+            _construct(VenuePricingResponse, package) for package in venue.pricing_packages
+        ]
+        data["availability"] = (
+            _construct(VenueAvailabilityResponse, venue.availability) if venue.availability else None
+        )
+        return cls.model_construct(**data)
 
 
 class VenueListResponse(BaseModel):
@@ -176,5 +203,4 @@ class VenueListResponse(BaseModel):
     verification_status: str
     hero_photo: Optional[str] = None  # URL of hero photo
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -2,12 +2,77 @@
 LLM service for generating match explanations using Claude API
 """
 
+import asyncio
+import hashlib
+import logging
 import os
-from typing import Dict, List
-from anthropic import Anthropic
+import weakref
+from typing import Dict, List, Tuple
+import orjson
+from anthropic import AsyncAnthropic
 
-from app.models.venue import Venue
+from app.core.cache import cache_get, cache_set
+from app.core.config import get_settings
+from app.services.matcher import VenueCandidate, VenueMatcher
 from app.models.brief import EventBrief
+from app.models.enums import display
+
+logger = logging.getLogger(__name__)
+
+
+# Instructions shared by every explanation request, sent as the system prompt
+# so the user message carries only the per-match details
+EXPLANATION_SYSTEM_PROMPT = """You are a venue matching expert. Generate a concise explanation (3-5 bullet points) for why the venue is a good match for the event described by the user.
+
+Focus on:
+1. The strongest match aspects (highest scoring categories)
+2. Specific details that make it suitable for this event type
+3. Any standout features or advantages
+
+Format as markdown bullet points. Keep each point concise (one sentence). Be enthusiastic but honest.
+
+Example format:
+- Perfect capacity for your <guest count>-person <event type>
+- Excellent location in <borough>, matching your preference
+- Within your budget with transparent pricing
+- Great amenities for <event type> events
+
+DO NOT include a heading or title. Start directly with the bullet points."""
+
+
+def _explanation_cache_key(prompt: str) -> str:
+    # Identical prompts get identical explanations, so key on the prompt itself
+    digest = hashlib.sha256(f"{EXPLANATION_SYSTEM_PROMPT}\n{prompt}".encode()).hexdigest()
+    return f"llm:explanation:{digest}"
+
+
+def _response_text(body: bytes) -> str:
+    # Only the first text block is used, so read it from the raw JSON instead
+    # of having the SDK build and validate a full Message model
+    return orjson.loads(body)["content"][0]["text"]
+
+
+# One semaphore per event loop, shared by every brief being explained on it
+_explanation_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _explanation_semaphore() -> asyncio.Semaphore:
+    """Cap on concurrent Claude calls across all briefs in this process"""
+    loop = asyncio.get_running_loop()
+    semaphore = _explanation_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(get_settings().EXPLANATION_CONCURRENCY)
+        _explanation_semaphores[loop] = semaphore
+    return semaphore
+
+
+def _needs_llm(score: float) -> bool:
+    # Clear winners and weak matches read the same every time, so the template
+    # covers them; Claude is only worth the call for the middle band
+    settings = get_settings()
+    return settings.EXPLANATION_LLM_MIN_SCORE <= score < settings.EXPLANATION_LLM_MAX_SCORE
 
 
 class MatchExplainer:
@@ -20,11 +85,11 @@ class MatchExplainer:
         api_key = os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY environment variable not set")
-        self.client = Anthropic(api_key=api_key)
+        self.async_client = AsyncAnthropic(api_key=api_key)
 
-    def generate_explanation(
+    async def generate_explanation_async(
         self,
-        venue: Venue,
+        venue: VenueCandidate,
         brief: EventBrief,
         score: float,
         match_details: Dict
@@ -35,56 +100,105 @@ class MatchExplainer:
         Returns:
             A concise explanation (3-5 bullet points) formatted as markdown.
         """
+        if not _needs_llm(score):
+            return self._generate_fallback_explanation(venue, brief, score, match_details)
+
         prompt = self._build_prompt(venue, brief, score, match_details)
+        cache_key = _explanation_cache_key(prompt)
+        # The cache client is blocking, so keep it off the event loop
+        cached = await asyncio.to_thread(cache_get, cache_key)
+        if cached is not None:
+            return cached.decode()
 
         try:
-            message = self.client.messages.create(
-                model="claude-3-haiku-20240307",  # Using Haiku for speed and cost
-                max_tokens=500,
-                temperature=0.7,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
+            raw = await self.async_client.messages.with_raw_response.create(**self._message_params(prompt))
+            explanation = _response_text(raw.content)
+            await asyncio.to_thread(
+                cache_set, cache_key, explanation, get_settings().EXPLANATION_CACHE_TTL_SECONDS
             )
-
-            # Extract the text content from the response
-            explanation = message.content[0].text
             return explanation
 
-        except Exception as e:
+        except Exception:
             # Fallback to a generic explanation if API fails
+            logger.warning("Claude explanation failed for venue %d", venue.id, exc_info=True)
             return self._generate_fallback_explanation(venue, brief, score, match_details)
 
+    async def generate_explanations(
+        self,
+        brief: EventBrief,
+        scored_venues: List[Tuple[VenueCandidate, float, Dict]]
+    ) -> List[str]:
+        """
+        Generate explanations for all matches concurrently.
+
+        The Claude calls are independent, so running them together makes the
+        total latency roughly that of the slowest call instead of the sum.
+        At most EXPLANATION_CONCURRENCY calls are in flight at once across
+        every brief in this process (e.g. concurrent arq jobs), to stay clear
+        of API rate limits.
+
+        Returns:
+            One explanation per entry in scored_venues, in the same order.
+        """
+        semaphore = _explanation_semaphore()
+
+        async def explain(venue: VenueCandidate, score: float, details: Dict) -> str:
+            async with semaphore:
+                return await self.generate_explanation_async(venue, brief, score, details)
+
+        results = await asyncio.gather(
+            *[explain(venue, score, details) for venue, score, details in scored_venues],
+            return_exceptions=True,
+        )
+
+        explanations = []
+        for (venue, score, details), result in zip(scored_venues, results):
+            if isinstance(result, Exception):
+                logger.warning("Failed to generate explanation for venue %d: %s", venue.id, result)
+                result = self._generate_fallback_explanation(venue, brief, score, details)
+            explanations.append(result)
+        return explanations
+
+    def _message_params(self, prompt: str) -> Dict:
+        """Build the Claude messages.create arguments for a prompt."""
+        return {
+            "model": "claude-3-haiku-20240307",  # Using Haiku for speed and cost
+            "max_tokens": 500,
+            "temperature": 0.7,
+            "system": EXPLANATION_SYSTEM_PROMPT,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+        }
+
     def _build_prompt(
         self,
-        venue: Venue,
+        venue: VenueCandidate,
         brief: EventBrief,
         score: float,
         match_details: Dict
     ) -> str:
-        """Build the prompt for Claude."""
+        """Build the per-match user message for Claude."""
 
         # Format event type
-        event_type = brief.event_type.value.replace('_', ' ').title()
+        event_type = display(brief.event_type)
 
         # Format borough
-        venue_borough = venue.borough.value.replace('_', ' ').title()
-        pref_borough = brief.borough_pref.value.replace('_', ' ').title() if brief.borough_pref else "Any"
+        venue_borough = display(venue.borough)
+        pref_borough = display(brief.borough_pref) if brief.borough_pref else "Any"
 
-        prompt = f"""You are a venue matching expert. Generate a concise explanation (3-5 bullet points) for why this venue is a good match for this event.
-
-EVENT DETAILS:
+        prompt = f"""EVENT DETAILS:
 - Type: {event_type}
 - Guest Count: {brief.headcount} people
 - Date: {brief.date_preferred}
 - Location Preference: {pref_borough}
 - Budget: ${brief.budget_min or 0} - ${brief.budget_max}
-- Food/Beverage: {brief.food_bev_level.value.replace('_', ' ').title()}
-- Alcohol: {brief.alcohol_level.value.replace('_', ' ').title()}
-- AV Needs: {brief.av_needs.value.replace('_', ' ').title()}
+- Food/Beverage: {display(brief.food_bev_level)}
+- Alcohol: {display(brief.alcohol_level)}
+- AV Needs: {display(brief.av_needs)}
 
 VENUE DETAILS:
 - Name: {venue.name}
@@ -99,28 +213,13 @@ SCORING BREAKDOWN:
 - Capacity Match: {match_details['capacity']['score']:.1f}/{match_details.get('capacity_weight', 30)} points
 - Price Match: {match_details['price']['score']:.1f}/{match_details.get('price_weight', 25)} points
 - Location Match: {match_details['location']['score']:.1f}/{match_details.get('location_weight', 20)} points
-- Amenities Match: {match_details['amenities']['score']:.1f}/{match_details.get('amenities_weight', 15)} points
-
-Generate 3-5 bullet points explaining why this venue is a good match. Focus on:
-1. The strongest match aspects (highest scoring categories)
-2. Specific details that make it suitable for this event type
-3. Any standout features or advantages
-
-Format as markdown bullet points. Keep each point concise (one sentence). Be enthusiastic but honest.
-
-Example format:
-- Perfect capacity for your {brief.headcount}-person {event_type.lower()}
-- Excellent location in {venue_borough}, matching your preference
-- Within your budget with transparent pricing
-- Great amenities for corporate events
-
-DO NOT include a heading or title. Start directly with the bullet points."""
+- Amenities Match: {match_details['amenities']['score']:.1f}/{match_details.get('amenities_weight', 15)} points"""
 
         return prompt
 
     def _generate_fallback_explanation(
         self,
-        venue: Venue,
+        venue: VenueCandidate,
         brief: EventBrief,
         score: float,
         match_details: Dict
@@ -130,25 +229,49 @@ DO NOT include a heading or title. Start directly with the bullet points."""
         """
         bullets = []
 
+        # Every category gets a bullet, so weaker matches still read as
+        # 3-5 points; partial scores say what to check rather than praise
+
         # Capacity
-        if match_details['capacity']['score'] > 20:
+        capacity_range = f"(capacity: {venue.capacity_min}-{venue.capacity_max})"
+        if brief.headcount > venue.capacity_max:
+            # Up to 20% over capacity still scores, anything more does not
+            if brief.headcount <= venue.capacity_max * 1.2:
+                bullets.append(f"- A snug fit for your {brief.headcount} guests {capacity_range}")
+            else:
+                bullets.append(f"- May be too small for your {brief.headcount} guests {capacity_range}")
+        elif brief.headcount < venue.capacity_min:
+            bullets.append(f"- Plenty of room for your {brief.headcount} guests {capacity_range}")
+        else:
             bullets.append(
                 f"- Comfortably accommodates your {brief.headcount} guests "
-                f"(capacity: {venue.capacity_min}-{venue.capacity_max})"
+                f"{capacity_range}"
             )
 
         # Location
+        venue_borough = display(venue.borough)
         if match_details['location']['score'] > 15:
-            venue_borough = venue.borough.value.replace('_', ' ').title()
             bullets.append(f"- Great location in {venue_borough}")
+        elif match_details['location']['score'] >= VenueMatcher.WEIGHT_LOCATION * 0.5:
+            bullets.append(f"- Located in {venue_borough}, close to your preferred area")
+        else:
+            bullets.append(f"- Located in {venue_borough}, outside your preferred borough")
 
         # Price
         if match_details['price']['score'] > 15:
             bullets.append(f"- Within your budget of ${brief.budget_max}")
+        elif not venue.base_price and not venue.min_spend:
+            bullets.append("- Pricing is available on request from the venue")
+        elif match_details['price']['score'] > 0:
+            bullets.append(f"- Slightly above your budget of ${brief.budget_max}, worth asking about packages")
+        else:
+            bullets.append(f"- Above your budget of ${brief.budget_max}, so check for packages that fit")
 
         # Amenities
         if match_details['amenities']['score'] > 10:
             bullets.append("- Has the amenities you need for your event")
+        else:
+            bullets.append("- Confirm catering, bar and AV arrangements with the venue")
 
         # Overall score
         if score >= 80:
@@ -156,4 +279,4 @@ DO NOT include a heading or title. Start directly with the bullet points."""
         elif score >= 60:
             bullets.append("- Strong match for your event needs")
 
-        return "\n".join(bullets) if bullets else "- Matches your event requirements"
+        return "\n".join(bullets)
@@ -2,14 +2,150 @@
 Venue matching service - Rules-based scoring algorithm
 """
 
-from typing import List, Dict, Tuple
+import heapq
+import threading
+import time
+from functools import lru_cache
+from itertools import product
+from operator import itemgetter
+from typing import List, Dict, NamedTuple, Optional, Tuple
 from datetime import datetime, date
+from cachetools import TTLCache
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.core.cache import cache_get, cache_incr
+from app.core.config import get_settings
+from app.models.enums import AlcoholLevel, AVNeeds, Borough, FoodBevLevel
 from app.models.venue import Venue
 from app.models.brief import EventBrief
 
 
+# Boroughs near enough to each other to earn partial location points
+CLOSE_BOROUGHS = {
+    Borough.MANHATTAN: {Borough.BROOKLYN},
+    Borough.BROOKLYN: {Borough.MANHATTAN},
+}
+
+# Share of the location weight for a venue outside the preferred borough,
+# keyed by (preferred, venue) borough
+OTHER_BOROUGH_SHARES = {
+    (pref, borough): 0.5 if borough in CLOSE_BOROUGHS.get(pref, ()) else 0.3
+    for pref in Borough
+    for borough in Borough
+    if borough is not pref
+}
+
+
+# Share of the amenities weight earned at each requirement level (5 points
+# each). Harder requirements earn less, since fewer venues can meet them.
+FOOD_BEV_SHARES = {
+    FoodBevLevel.NONE: 0.33,           # No requirement, easy match
+    FoodBevLevel.LIGHT_BITES: 0.25,    # Assume most venues can do light bites
+    FoodBevLevel.FULL_CATERING: 0.20,  # Full catering is harder
+}
+ALCOHOL_SHARES = {
+    AlcoholLevel.NONE: 0.33,       # No requirement, easy match
+    AlcoholLevel.BEER_WINE: 0.25,  # Most venues can do beer/wine
+    AlcoholLevel.FULL_BAR: 0.20,   # Full bar is harder
+}
+AV_SHARES = {
+    AVNeeds.NONE: 0.34,        # No requirement, easy match
+    AVNeeds.BASIC_MIC: 0.25,   # Basic AV is common
+    AVNeeds.FULL_SETUP: 0.20,  # Full AV setup is harder
+}
+
+
+def _amenities_table(weight: float) -> Dict[Tuple[FoodBevLevel, AlcoholLevel, AVNeeds], float]:
+    """Amenities score for every (food/bev, alcohol, AV) combination"""
+    return {
+        (food_bev, alcohol, av): (
+            weight * FOOD_BEV_SHARES[food_bev] + weight * ALCOHOL_SHARES[alcohol] + weight * AV_SHARES[av]
+        )
+        for food_bev, alcohol, av in product(FoodBevLevel, AlcoholLevel, AVNeeds)
+    }
+
+
+class VenueCandidate(NamedTuple):
+    """The venue columns needed to score and explain a match"""
+
+    id: int
+    name: str
+    borough: Borough
+    neighborhood: Optional[str]
+    capacity_min: int
+    capacity_max: int
+    base_price: Optional[float]
+    min_spend: Optional[float]
+
+
+# Verified venues change far less often than briefs are matched, so the
+# candidate list is kept in-process. Venue writes bump a version counter in
+# Redis, which every process checks before reusing its list; when it can't be
+# read, only writes in this process are seen and the TTL bounds staleness.
+MATCH_VENUE_VERSION_KEY = "venues:match:version"
+_VENUE_CACHE = {"version": 0, "loaded_version": -1, "shared_version": None, "ts": 0.0, "venues": []}
+_venue_cache_lock = threading.Lock()
+
+_candidate_query = select(
+    Venue.id,
+    Venue.name,
+    Venue.borough,
+    Venue.neighborhood,
+    Venue.capacity_min,
+    Venue.capacity_max,
+    Venue.base_price,
+    Venue.min_spend,
+).where(Venue.verification_status == "verified")
+
+
+# Rankings for recently matched briefs; see VenueMatcher.find_matches
+_ranking_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_ranking_cache() -> TTLCache:
+    """Cache of recent rankings keyed by the brief fields that affect scoring"""
+    return TTLCache(maxsize=256, ttl=get_settings().MATCH_VENUE_CACHE_TTL_SECONDS)
+
+
+def invalidate_venue_candidates() -> None:
+    """Force the next match in every process to reload verified venues"""
+    with _venue_cache_lock:
+        _VENUE_CACHE["version"] += 1
+    cache_incr(MATCH_VENUE_VERSION_KEY)
+
+
+def get_venue_candidates(db: Session) -> List[VenueCandidate]:
+    """Return verified venues, reloading them once the cached list is stale"""
+    # None when Redis is disabled or unreachable, or before the first write
+    shared_version = cache_get(MATCH_VENUE_VERSION_KEY)
+    with _venue_cache_lock:
+        if _VENUE_CACHE["loaded_version"] == _VENUE_CACHE["version"]:
+            if shared_version is not None:
+                fresh = _VENUE_CACHE["shared_version"] == shared_version
+            else:
+                ttl = get_settings().MATCH_VENUE_CACHE_TTL_SECONDS
+                fresh = time.monotonic() - _VENUE_CACHE["ts"] < ttl
+            if fresh:
+                return _VENUE_CACHE["venues"]
+        version = _VENUE_CACHE["version"]
+
+    venues = [VenueCandidate(*row) for row in db.execute(_candidate_query)]
+
+    with _venue_cache_lock:
+        # A write that landed during the query leaves the list stale; keep it
+        # for this call but don't cache it
+        if _VENUE_CACHE["version"] == version:
+            _VENUE_CACHE.update(
+                loaded_version=version,
+                shared_version=shared_version,
+                ts=time.monotonic(),
+                venues=venues,
+            )
+    return venues
+
+
 class VenueMatcher:
     """
     Rules-based venue matching with scoring algorithm.
@@ -23,103 +159,137 @@ class VenueMatcher:
     WEIGHT_AMENITIES = 15
     WEIGHT_AVAILABILITY = 10
 
+    # Requirements only take a few values each, so every amenities score is precomputed
+    AMENITIES_SCORES = _amenities_table(WEIGHT_AMENITIES)
+
     def __init__(self, db: Session):
         self.db = db
 
-    def find_matches(self, brief: EventBrief, limit: int = 10) -> List[Tuple[Venue, float, Dict]]:
+    def find_matches(self, brief: EventBrief, limit: int = 10) -> List[Tuple[VenueCandidate, float, Dict]]:
         """
         Find and score venues that match the brief.
 
         Returns:
             List of tuples: (venue, score, match_details)
-            - venue: The Venue object
+            - venue: The VenueCandidate row
             - score: Float between 0-100
             - match_details: Dict with scoring breakdown
         """
-        # Get all verified venues
-        venues = self.db.query(Venue).filter(
-            Venue.verification_status == "verified"
-        ).all()
-
-        # Score each venue
-        scored_venues = []
-        for venue in venues:
-            score, details = self._score_venue(venue, brief)
-            if score > 0:  # Only include venues with some match
-                scored_venues.append((venue, score, details))
-
-        # Sort by score (highest first)
-        scored_venues.sort(key=lambda x: x[1], reverse=True)
-
-        # Return top matches
-        return scored_venues[:limit]
-
-    def _score_venue(self, venue: Venue, brief: EventBrief) -> Tuple[float, Dict]:
+        candidates = get_venue_candidates(self.db)
+
+        # Scores depend only on these brief fields, so briefs asking for the
+        # same thing share a ranking
+        key = (
+            brief.headcount,
+            brief.budget_min,
+            brief.budget_max,
+            brief.borough_pref,
+            (brief.neighborhood_pref or "").lower(),
+            brief.food_bev_level,
+            brief.alcohol_level,
+            brief.av_needs,
+            limit,
+        )
+        cache = _get_ranking_cache()
+        with _ranking_cache_lock:
+            cached = cache.get(key)
+
+        # A ranking is only reused against the candidate list it was built from
+        if cached is not None and cached[0] is candidates:
+            ranked = cached[1]
+        else:
+            ranked = self._rank_candidates(candidates, brief, limit)
+            with _ranking_cache_lock:
+                cache[key] = (candidates, ranked)
+
+        return [
+            (venue, score, self._match_details(venue, brief, components, score))
+            for venue, score, components in ranked
+        ]
+
+    def _rank_candidates(
+        self,
+        candidates: List[VenueCandidate],
+        brief: EventBrief,
+        limit: int,
+    ) -> List[Tuple[VenueCandidate, float, Tuple[float, float, float, float, float]]]:
         """
-        Score a single venue against a brief.
+        Score candidates against a brief and keep the best.
 
         Returns:
-            Tuple of (total_score, details_dict)
+            Up to limit tuples of (venue, score, component scores), highest score first
         """
-        details = {}
-
-        # 1. Capacity Score (30 points)
-        capacity_score = self._score_capacity(venue, brief)
-        details['capacity'] = {
-            'score': capacity_score,
-            'venue_range': f"{venue.capacity_min}-{venue.capacity_max}",
-            'required': brief.headcount,
-        }
-
-        # 2. Price Score (25 points)
-        price_score = self._score_price(venue, brief)
-        details['price'] = {
-            'score': price_score,
-            'venue_base': venue.base_price,
-            'venue_min_spend': venue.min_spend,
-            'budget': brief.budget_max,
-        }
-
-        # 3. Location Score (20 points)
-        location_score = self._score_location(venue, brief)
-        details['location'] = {
-            'score': location_score,
-            'venue_borough': venue.borough.value,
-            'preferred_borough': brief.borough_pref.value if brief.borough_pref else None,
-        }
-
-        # 4. Amenities Score (15 points)
-        amenities_score = self._score_amenities(venue, brief)
-        details['amenities'] = {
-            'score': amenities_score,
-            'food_bev_match': brief.food_bev_level.value,
-            'alcohol_match': brief.alcohol_level.value,
-            'av_match': brief.av_needs.value,
-        }
-
-        # 5. Availability Score (10 points)
-        # For MVP, we'll give full points (no calendar integration yet)
-        availability_score = self.WEIGHT_AVAILABILITY
-        details['availability'] = {
-            'score': availability_score,
-            'note': 'Calendar sync not implemented in MVP',
+        # Brief fields are the same for every venue, so read them once
+        headcount = brief.headcount
+        budget_min = brief.budget_min
+        budget_max = brief.budget_max
+        borough_pref = brief.borough_pref
+        neighborhood_pref = (brief.neighborhood_pref or "").lower()
+        # Amenities are scored from the brief alone, so every venue gets the same score
+        amenities_score = self._score_amenities(brief)
+
+        # Score each venue. Only the component scores are kept here; the
+        # details dict is built for the venues that make the cut.
+        scored_venues = []
+        for venue in candidates:
+            components = (
+                # Capacity (30), price (25), location (20), amenities (15)
+                self._score_capacity(venue.capacity_min, venue.capacity_max, headcount),
+                self._score_price(venue.base_price, venue.min_spend, budget_min, budget_max),
+                self._score_location(venue.borough, venue.neighborhood, borough_pref, neighborhood_pref),
+                amenities_score,
+                # Availability (10): full points for MVP, no calendar integration yet
+                self.WEIGHT_AVAILABILITY,
+            )
+            score = sum(components)
+            if score > 0:  # Only include venues with some match
+                scored_venues.append((venue, score, components))
+
+        # Return top matches (highest score first)
+        return heapq.nlargest(limit, scored_venues, key=itemgetter(1))
+
+    def _match_details(
+        self,
+        venue: VenueCandidate,
+        brief: EventBrief,
+        components: Tuple[float, float, float, float, float],
+        total_score: float,
+    ) -> Dict:
+        """Build the scoring breakdown for a ranked venue"""
+        capacity_score, price_score, location_score, amenities_score, availability_score = components
+
+        return {
+            'capacity': {
+                'score': capacity_score,
+                'venue_range': f"{venue.capacity_min}-{venue.capacity_max}",
+                'required': brief.headcount,
+            },
+            'price': {
+                'score': price_score,
+                'venue_base': venue.base_price,
+                'venue_min_spend': venue.min_spend,
+                'budget': brief.budget_max,
+            },
+            'location': {
+                'score': location_score,
+                'venue_borough': venue.borough.value,
+                'preferred_borough': brief.borough_pref.value if brief.borough_pref else None,
+            },
+            'amenities': {
+                'score': amenities_score,
+                'food_bev_match': brief.food_bev_level.value,
+                'alcohol_match': brief.alcohol_level.value,
+                'av_match': brief.av_needs.value,
+            },
+            'availability': {
+                'score': availability_score,
+                'note': 'Calendar sync not implemented in MVP',
+            },
+            'total': total_score,
+            'max_possible': 100,
         }
 
-        # Calculate total score
-        total_score = (
-            capacity_score +
-            price_score +
-            location_score +
-            amenities_score +
-            availability_score
-        )
-
-        details['total'] = total_score
-        details['max_possible'] = 100
-
-        return total_score, details
-
-    def _score_capacity(self, venue: Venue, brief: EventBrief) -> float:
+    def _score_capacity(self, capacity_min: int, capacity_max: int, headcount: int) -> float:
         """
         Score based on capacity match.
         - Perfect match (within range): 100% of weight
@@ -127,123 +297,94 @@ class VenueMatcher:
         - Too small: 0%
         - Too large (but usable): 50% of weight
         """
-        headcount = brief.headcount
-
         # Perfect match - within venue's stated range
-        if venue.capacity_min <= headcount <= venue.capacity_max:
+        if capacity_min <= headcount <= capacity_max:
             return self.WEIGHT_CAPACITY
 
         # Too small - can't accommodate
-        if headcount > venue.capacity_max:
+        if headcount > capacity_max:
             # Check if it's close (within 20%)
-            if headcount <= venue.capacity_max * 1.2:
+            if headcount <= capacity_max * 1.2:
                 return self.WEIGHT_CAPACITY * 0.7
             return 0
 
         # Too large - venue can handle it but might feel empty
-        if headcount < venue.capacity_min:
+        if headcount < capacity_min:
             # Check if it's close (within 20%)
-            if headcount >= venue.capacity_min * 0.8:
+            if headcount >= capacity_min * 0.8:
                 return self.WEIGHT_CAPACITY * 0.7
             return self.WEIGHT_CAPACITY * 0.5
 
         return 0
 
-    def _score_price(self, venue: Venue, brief: EventBrief) -> float:
+    def _score_price(
+        self,
+        base_price: Optional[float],
+        min_spend: Optional[float],
+        budget_min: Optional[float],
+        budget_max: float,
+    ) -> float:
         """
         Score based on price match.
         Uses venue's base_price or min_spend if available.
         """
         # If we don't have pricing info, give neutral score
-        if not venue.base_price and not venue.min_spend:
+        if not base_price and not min_spend:
             return self.WEIGHT_PRICE * 0.5
 
         # Use the higher of base_price or min_spend as the cost estimate
-        venue_cost = max(venue.base_price or 0, venue.min_spend or 0)
+        venue_cost = max(base_price or 0, min_spend or 0)
 
         # Within budget
-        if venue_cost <= brief.budget_max:
+        if venue_cost <= budget_max:
             # Check if it's within min-max range
-            if brief.budget_min and venue_cost >= brief.budget_min:
+            if budget_min and venue_cost >= budget_min:
                 return self.WEIGHT_PRICE  # Perfect match
-            elif not brief.budget_min:
+            elif not budget_min:
                 return self.WEIGHT_PRICE  # Good match (no minimum specified)
             else:
                 return self.WEIGHT_PRICE * 0.7  # Below minimum but affordable
 
         # Slightly over budget (within 10%)
-        if venue_cost <= brief.budget_max * 1.1:
+        if venue_cost <= budget_max * 1.1:
             return self.WEIGHT_PRICE * 0.6
 
         # Too expensive
         return 0
 
-    def _score_location(self, venue: Venue, brief: EventBrief) -> float:
+    def _score_location(
+        self,
+        borough: Borough,
+        neighborhood: Optional[str],
+        borough_pref: Optional[Borough],
+        neighborhood_pref: str,
+    ) -> float:
         """
         Score based on location match.
+        neighborhood_pref is expected lowercased ("" for no preference).
         """
         # No preference specified - all locations are equal
-        if not brief.borough_pref:
+        if not borough_pref:
             return self.WEIGHT_LOCATION
 
         # Exact borough match
-        if venue.borough == brief.borough_pref:
+        if borough is borough_pref:
             # Check neighborhood match if specified
-            if brief.neighborhood_pref and venue.neighborhood:
-                if brief.neighborhood_pref.lower() in venue.neighborhood.lower():
+            if neighborhood_pref and neighborhood:
+                if neighborhood_pref in neighborhood.lower():
                     return self.WEIGHT_LOCATION  # Perfect match
                 return self.WEIGHT_LOCATION * 0.9  # Borough match, different neighborhood
             return self.WEIGHT_LOCATION  # Borough match, no neighborhood pref
 
-        # Different borough - lower score
-        # Manhattan <-> Brooklyn are close, give partial points
-        close_boroughs = {
-            'manhattan': ['brooklyn'],
-            'brooklyn': ['manhattan'],
-        }
-
-        venue_borough = venue.borough.value
-        pref_borough = brief.borough_pref.value
+        # Different borough - lower score, with partial points for close
+        # pairs (Manhattan <-> Brooklyn)
+        return self.WEIGHT_LOCATION * OTHER_BOROUGH_SHARES[(borough_pref, borough)]
 
-        if venue_borough in close_boroughs.get(pref_borough, []):
-            return self.WEIGHT_LOCATION * 0.5
-
-        # Different borough, not adjacent
-        return self.WEIGHT_LOCATION * 0.3
-
-    def _score_amenities(self, venue: Venue, brief: EventBrief) -> float:
+    def _score_amenities(self, brief: EventBrief) -> float:
         """
         Score based on amenities match.
         Checks if venue can provide required food/beverage, alcohol, and AV.
         """
-        score = 0
-        max_score = self.WEIGHT_AMENITIES
-
         # For MVP, we'll give partial scores based on requirements
         # In production, you'd check venue.amenities for specific capabilities
-
-        # Food/Beverage (5 points)
-        if brief.food_bev_level.value == 'none':
-            score += max_score * 0.33  # No requirement, easy match
-        elif brief.food_bev_level.value == 'light_bites':
-            score += max_score * 0.25  # Assume most venues can do light bites
-        elif brief.food_bev_level.value == 'full_catering':
-            score += max_score * 0.20  # Full catering is harder, lower score
-
-        # Alcohol (5 points)
-        if brief.alcohol_level.value == 'none':
-            score += max_score * 0.33  # No requirement, easy match
-        elif brief.alcohol_level.value == 'beer_wine':
-            score += max_score * 0.25  # Most venues can do beer/wine
-        elif brief.alcohol_level.value == 'full_bar':
-            score += max_score * 0.20  # Full bar is harder, lower score
-
-        # AV Needs (5 points)
-        if brief.av_needs.value == 'none':
-            score += max_score * 0.34  # No requirement, easy match
-        elif brief.av_needs.value == 'basic_mic':
-            score += max_score * 0.25  # Basic AV is common
-        elif brief.av_needs.value == 'full_setup':
-            score += max_score * 0.20  # Full AV setup is harder, lower score
-
-        return score
+        return self.AMENITIES_SCORES[(brief.food_bev_level, brief.alcohol_level, brief.av_needs)]
@@ -0,0 +1,148 @@
+"""
+Venue matching worker
+
+Match generation makes one Claude call per ranked venue, so it runs outside
+the request cycle. With MATCH_QUEUE_ENABLED it is queued on Redis and run by
+a separate arq worker process:
+
+    arq app.workers.matching.WorkerSettings
+
+Otherwise it falls back to FastAPI BackgroundTasks in the API process.
+"""
+
+import asyncio
+import logging
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+
+from anyio import from_thread
+from arq.connections import RedisSettings
+from fastapi import BackgroundTasks, Request
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.logging_config import setup_logging
+from app.db.base import SessionLocal
+from app.models.brief import EventBrief
+from app.models.offer import MatchResult
+from app.services.llm import MatchExplainer
+from app.services.matcher import VenueCandidate, VenueMatcher
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_match_generation(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    brief_id: int,
+) -> None:
+    """
+    Schedule match generation for a brief.
+
+    Must be called from a sync (threadpool) endpoint: the arq pool lives on
+    the event loop, so the job is enqueued via anyio's from_thread.
+    """
+    arq_pool = getattr(request.app.state, "arq_pool", None)
+    if arq_pool is None:
+        background_tasks.add_task(generate_matches_for_brief, brief_id)
+        return
+
+    # A fixed job ID makes arq ignore repeat requests while a job is pending
+    from_thread.run(partial(
+        arq_pool.enqueue_job,
+        "generate_matches_task",
+        brief_id,
+        _job_id=f"generate_matches:{brief_id}",
+    ))
+
+
+async def generate_matches_for_brief(brief_id: int) -> int:
+    """
+    Generate venue matches for a brief and store them in the database.
+
+    Database work runs in a thread so the event loop is free while the Claude
+    explanations are generated concurrently.
+
+    Returns:
+        Number of matches stored
+    """
+    db = SessionLocal()
+    try:
+        brief, scored_venues = await asyncio.to_thread(_score_venues, db, brief_id)
+        if not brief:
+            logger.warning("Brief %d not found, skipping matching", brief_id)
+            return 0
+
+        # Generate all explanations concurrently using Claude
+        explainer = MatchExplainer()
+        explanations = await explainer.generate_explanations(brief, scored_venues)
+
+        await asyncio.to_thread(_store_matches, db, brief_id, scored_venues, explanations)
+        logger.info("Generated %d matches for brief %d", len(scored_venues), brief_id)
+        return len(scored_venues)
+
+    except Exception:
+        await asyncio.to_thread(db.rollback)
+        logger.exception("Error generating matches for brief %d", brief_id)
+        raise
+    finally:
+        await asyncio.to_thread(db.close)
+
+
+def _score_venues(
+    db: Session,
+    brief_id: int,
+) -> Tuple[Optional[EventBrief], List[Tuple[VenueCandidate, float, Dict]]]:
+    """Load the brief and find its top-scoring venues."""
+    brief = db.get(EventBrief, brief_id)
+    if not brief:
+        return None, []
+
+    matcher = VenueMatcher(db)
+    return brief, matcher.find_matches(brief, limit=10)
+
+
+def _store_matches(
+    db: Session,
+    brief_id: int,
+    scored_venues: List[Tuple[VenueCandidate, float, Dict]],
+    explanations: List[str],
+) -> None:
+    """Store ranked matches with a single multi-row INSERT."""
+    match_rows = [
+        {
+            "brief_id": brief_id,
+            "venue_id": venue.id,
+            "score": score,
+            "explanation": explanation,
+            "rank": rank,
+        }
+        for rank, ((venue, score, details), explanation) in enumerate(
+            zip(scored_venues, explanations), start=1
+        )
+    ]
+
+    if match_rows:
+        db.execute(insert(MatchResult), match_rows)
+    db.commit()
+
+
+async def startup(ctx: Dict) -> None:
+    """arq worker startup hook."""
+    setup_logging()
+
+
+async def generate_matches_task(ctx: Dict, brief_id: int) -> int:
+    """arq entry point for generate_matches_for_brief."""
+    return await generate_matches_for_brief(brief_id)
+
+
+class WorkerSettings:
+    """arq worker configuration"""
+
+    functions = [generate_matches_task]
+    on_startup = startup
+    # Don't keep results, so the job ID only dedupes queued/running jobs
+    keep_result = 0
+    redis_settings = RedisSettings.from_dsn(get_settings().REDIS_URL or "redis://localhost:6379")
@@ -0,0 +1,24 @@
+"""
+Gunicorn configuration for running the API with uvicorn workers
+
+    gunicorn -c gunicorn.conf.py app.main:app
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Import and build the app once in the master so workers fork with routes,
+# schemas and settings already loaded (shared copy-on-write memory)
+preload_app = True
+
+
+def post_fork(server, worker):
+    """Give each worker its own database connections and log listener thread"""
+    from app.core.logging_config import restart_logging_after_fork
+    from app.db.base import engine
+
+    engine.dispose(close=False)
+    restart_logging_after_fork()
@@ -0,0 +1,62 @@
+"""
+Shared pytest fixtures: an in-memory SQLite database and a FastAPI test client
+"""
+
+import os
+
+os.environ.setdefault("ANTHROPIC_API_KEY", "test-key")
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.db.base as db_base
+
+# Point every session at one shared in-memory database before the app is imported
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+db_base.SessionLocal = TestingSessionLocal
+
+import app.models  # noqa: E402,F401  (registers the tables on Base.metadata)
+from app.main import app  # noqa: E402
+
+
+def _get_test_db():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def client():
+    """Test client backed by a fresh, empty database"""
+    db_base.Base.metadata.create_all(engine)
+    app.dependency_overrides[db_base.get_db] = _get_test_db
+    try:
+        with TestClient(app) as test_client:
+            yield test_client
+    finally:
+        app.dependency_overrides.clear()
+        db_base.Base.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def auth_headers(client):
+    """Bearer token for a freshly registered host who also owns venues"""
+    client.post("/api/auth/register", json={
+        "email": "host@example.com",
+        "password": "password1",
+        "name": "Host",
+        "is_host": True,
+        "is_venue_owner": True,
+    })
+    response = client.post("/api/auth/login", json={"email": "host@example.com", "password": "password1"})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
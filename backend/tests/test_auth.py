@@ -0,0 +1,33 @@
+"""
+Tests for the auth endpoints
+"""
+
+USER = {"email": "guest@example.com", "password": "password1", "name": "Guest", "phone": "+12125551234"}
+
+
+def test_register_rejects_duplicate_email(client):
+    assert client.post("/api/auth/register", json=USER).status_code == 201
+
+    response = client.post("/api/auth/register", json=dict(USER, phone=None))
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Email already registered"
+
+
+def test_register_rejects_duplicate_phone(client):
+    assert client.post("/api/auth/register", json=USER).status_code == 201
+
+    response = client.post("/api/auth/register", json=dict(USER, email="other@example.com"))
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Phone number already registered"
+
+
+def test_register_after_duplicate_still_works(client):
+    client.post("/api/auth/register", json=USER)
+    client.post("/api/auth/register", json=USER)
+
+    response = client.post("/api/auth/register", json=dict(USER, email="new@example.com", phone=None))
+
+    assert response.status_code == 201
+    assert response.json()["email"] == "new@example.com"
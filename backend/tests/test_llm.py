@@ -0,0 +1,73 @@
+"""
+Tests for the template explanations used outside the Claude score band
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.models.enums import Borough
+from app.services.llm import MatchExplainer
+from app.services.matcher import VenueCandidate
+
+
+def _venue(capacity_min=50, capacity_max=100):
+    return VenueCandidate(
+        id=1,
+        name="Loft",
+        borough=Borough.MANHATTAN,
+        neighborhood="SoHo",
+        capacity_min=capacity_min,
+        capacity_max=capacity_max,
+        base_price=1000.0,
+        min_spend=None,
+    )
+
+
+def _details(capacity=30.0, location=20.0, price=25.0, amenities=15.0):
+    return {
+        "capacity": {"score": capacity},
+        "location": {"score": location},
+        "price": {"score": price},
+        "amenities": {"score": amenities},
+    }
+
+
+def _capacity_bullet(headcount, capacity_score):
+    brief = SimpleNamespace(headcount=headcount, budget_max=5000)
+    explanation = MatchExplainer()._generate_fallback_explanation(
+        _venue(), brief, 90, _details(capacity=capacity_score)
+    )
+    return explanation.splitlines()[0]
+
+
+@pytest.mark.parametrize(
+    "headcount, capacity_score, expected",
+    [
+        (75, 30.0, "- Comfortably accommodates your 75 guests"),
+        (110, 21.0, "- A snug fit for your 110 guests"),
+        (120, 21.0, "- A snug fit for your 120 guests"),
+        (121, 0, "- May be too small for your 121 guests"),
+        (45, 21.0, "- Plenty of room for your 45 guests"),
+        (10, 15.0, "- Plenty of room for your 10 guests"),
+    ],
+)
+def test_capacity_bullet_follows_headcount(headcount, capacity_score, expected):
+    assert _capacity_bullet(headcount, capacity_score).startswith(expected)
+
+
+def test_capacity_bullet_includes_range():
+    assert _capacity_bullet(75, 30.0).endswith("(capacity: 50-100)")
+
+
+def test_fallback_has_three_to_five_bullets():
+    brief = SimpleNamespace(headcount=75, budget_max=5000)
+    explainer = MatchExplainer()
+
+    weak = explainer._generate_fallback_explanation(
+        _venue(), brief, 20, _details(capacity=0, location=6.0, price=0, amenities=0)
+    )
+    strong = explainer._generate_fallback_explanation(_venue(), brief, 95, _details())
+
+    assert 3 <= len(weak.splitlines()) <= 5
+    assert 3 <= len(strong.splitlines()) <= 5
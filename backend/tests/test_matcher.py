@@ -0,0 +1,78 @@
+"""
+Tests for the in-process verified-venue cache used by matching
+"""
+
+import pytest
+
+import app.services.matcher as matcher
+from app.models.enums import Borough
+from app.models.venue import Venue
+from tests.conftest import TestingSessionLocal
+
+
+class FakeRedis:
+    """Just enough of redis.Redis for the version counter"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def incr(self, key):
+        value = int(self.data.get(key, b"0")) + 1
+        self.data[key] = str(value).encode()
+        return value
+
+
+@pytest.fixture
+def db(client):
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr("app.core.cache.get_redis", lambda: fake)
+    return fake
+
+
+def _add_venue(db, name):
+    db.add(Venue(
+        owner_id=1,
+        name=name,
+        borough=Borough.MANHATTAN,
+        address="1 Main St",
+        capacity_min=10,
+        capacity_max=100,
+        verification_status="verified",
+    ))
+    db.commit()
+
+
+def test_candidates_reload_when_another_process_writes(db, redis):
+    matcher.invalidate_venue_candidates()
+    _add_venue(db, "First")
+    assert [v.name for v in matcher.get_venue_candidates(db)] == ["First"]
+
+    # A write in another process only touches the database and Redis
+    _add_venue(db, "Second")
+    assert [v.name for v in matcher.get_venue_candidates(db)] == ["First"]
+    redis.incr(matcher.MATCH_VENUE_VERSION_KEY)
+
+    assert [v.name for v in matcher.get_venue_candidates(db)] == ["First", "Second"]
+
+
+def test_candidates_fall_back_to_ttl_without_redis(db, monkeypatch):
+    monkeypatch.setattr("app.core.cache.get_redis", lambda: None)
+    matcher.invalidate_venue_candidates()
+    _add_venue(db, "First")
+    first = matcher.get_venue_candidates(db)
+    assert matcher.get_venue_candidates(db) is first
+
+    monkeypatch.setitem(matcher._VENUE_CACHE, "ts", 0.0)
+    assert matcher.get_venue_candidates(db) is not first
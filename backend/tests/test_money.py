@@ -0,0 +1,39 @@
+"""
+Tests for money fields, which are stored as NUMERIC(12, 2)
+"""
+
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.brief import EventBriefCreate
+from app.schemas.common import MAX_MONEY
+from app.schemas.venue import VenueCreate
+
+BRIEF = {"event_type": "corporate", "headcount": 50, "date_preferred": str(date.today())}
+VENUE = {"name": "Loft", "borough": "manhattan", "address": "1 Main St", "capacity_min": 20, "capacity_max": 100}
+
+
+@pytest.mark.parametrize("amount, cents", [(1000.555, 1000.56), ("12.345", 12.35), (2.675, 2.68), (100, 100.0)])
+def test_amounts_round_to_cents(amount, cents):
+    assert EventBriefCreate(**BRIEF, budget_max=amount).budget_max == cents
+    assert VenueCreate(**VENUE, base_price=amount).base_price == cents
+
+
+def test_bounds_apply_after_rounding():
+    with pytest.raises(ValidationError):
+        VenueCreate(**VENUE, base_price=0.001)
+    with pytest.raises(ValidationError):
+        EventBriefCreate(**BRIEF, budget_max=MAX_MONEY + 0.01)
+    assert EventBriefCreate(**BRIEF, budget_max=0.001).budget_max == 0.0
+
+
+def test_created_venue_and_brief_echo_stored_amounts(client, auth_headers):
+    response = client.post("/api/venues", json=dict(VENUE, base_price=1000.555), headers=auth_headers)
+    assert response.status_code == 201
+    assert response.json()["base_price"] == 1000.56
+
+    response = client.post("/api/briefs/", json=dict(BRIEF, budget_max=1000.555), headers=auth_headers)
+    assert response.status_code == 201
+    assert response.json()["budget_max"] == 1000.56
@@ -0,0 +1,81 @@
+"""
+Tests for JWT verification and its decoded-token cache
+"""
+
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+
+import jwt
+import pytest
+
+from app.core import security
+from app.core.security import create_access_token, verify_token
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.time() for the security module"""
+    now = [time.time()]
+    monkeypatch.setattr(security, "time", SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def decode_calls(monkeypatch):
+    """Count the signature checks verify_token falls through to"""
+    security._get_token_cache.cache_clear()
+    calls = []
+    real_decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(security.jwt, "decode", counting_decode)
+    return calls
+
+
+def test_verified_token_is_served_from_cache(decode_calls, clock):
+    token = create_access_token({"sub": "1"})
+
+    assert verify_token(token)["sub"] == "1"
+    assert verify_token(token)["sub"] == "1"
+    assert len(decode_calls) == 1
+
+
+def test_cache_entry_expires_after_ttl(decode_calls, clock):
+    token = create_access_token({"sub": "1"})
+    verify_token(token)
+
+    clock[0] += security._get_token_cache().ttl + 1
+
+    assert verify_token(token)["sub"] == "1"
+    assert len(decode_calls) == 2
+
+
+def test_cache_entry_never_outlives_token(decode_calls, clock):
+    token = create_access_token({"sub": "1"}, expires_delta=timedelta(seconds=5))
+    verify_token(token)
+
+    # Still inside the cache TTL, but past the token's own expiry
+    clock[0] += 6
+    verify_token(token)
+
+    assert len(decode_calls) == 2
+
+
+def test_invalid_tokens_are_not_cached(decode_calls, clock):
+    assert verify_token("not-a-token") is None
+    assert verify_token("not-a-token") is None
+    assert len(decode_calls) == 2
+
+
+def test_cache_can_be_disabled(decode_calls, clock, monkeypatch):
+    monkeypatch.setattr(security, "_get_token_cache", lambda: None)
+    token = create_access_token({"sub": "1"})
+
+    verify_token(token)
+    verify_token(token)
+
+    assert len(decode_calls) == 2